@@ -7,16 +7,46 @@ Core of the system - fast check-in with paralysis detection.
 from datetime import date
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
-from src.core.database import get_session
-from src.core.models import DailyLog
-from src.core.metrics import check_circuit_breaker_conditions
+from src.cli.output import ask_choice, make_console, print_panel
+from src.core import fastread
 
-app = typer.Typer(help="Daily execution commands")
-console = Console()
+# Database/metrics imports are deferred into the commands that write, so
+# `daily show` (raw sqlite3 read) never loads SQLAlchemy.
+
+app = typer.Typer(help="Daily execution commands", add_completion=False)
+console = make_console()
+
+STATUS_CHOICES = ("shipped", "blocked", "deferred")
+VALID_STATUSES = frozenset(STATUS_CHOICES)
+STATUS_COLORS = {"shipped": "green", "blocked": "red"}
+ENERGY_CHOICES = ("high", "medium", "low")
+ACTION_CHOICES = ("1", "2", "3")
+BLOCKER_CHOICES = ("me_decision", "external", "other")
+
+
+def _insert_checkin(session, **values) -> bool:
+    """Insert today's log in one statement.
+
+    Returns False (and writes nothing) if a log for that date already
+    exists, e.g. from a check-in finished in another terminal meanwhile.
+    """
+    from src.core.database import INSERT_DAILY_LOG
+
+    return session.execute(INSERT_DAILY_LOG.values(**values)).rowcount > 0
+
+
+def _report_missing_mission(row) -> bool:
+    """Explain why today's mission can't be completed, if it can't."""
+    if row is None:
+        console.print("[red]No check-in found for today[/red]")
+        console.print("[yellow]Run: ceo daily checkin[/yellow]")
+        return True
+    if row.mission is None:
+        console.print("[red]No mission set for today[/red]")
+        return True
+    return False
 
 
 @app.command()
@@ -25,39 +55,49 @@ def checkin():
 
     Detects paralysis and forces protocol if needed.
     """
-    session = get_session()
-
-    try:
-        console.print("\n[bold cyan]🌅 Morning Check-in[/bold cyan]\n")
-
-        # Check if already done today
-        today = date.today()
-        existing = session.query(DailyLog).filter(DailyLog.date == today).first()
-
-        if existing:
-            console.print("[yellow]Already checked in today![/yellow]")
-            if existing.mission:
-                console.print(f"\nMission: {existing.mission}")
-                console.print(f"Status: {existing.mission_status or 'in progress'}\n")
-            return
-
-        # Energy check
-        energy = Prompt.ask(
-            "Energy level",
-            choices=["high", "medium", "low"],
-            default="medium",
-        )
-
-        # Paralysis detection (simplified to single question)
-        console.print(
-            "\n[bold]Paralysis Check:[/bold] Physical tension OR circular thinking?"
-        )
-        paralysis = Confirm.ask("Detect any paralysis signals?", default=False)
-
-        # If paralysis detected, force immediate action
-        if paralysis:
+    from src.core.database import DAILY_LOG_SUMMARY, scoped_session
+    from src.core.metrics import check_circuit_breaker_conditions
+
+    with scoped_session() as session:
+        try:
+            console.print("\n[bold cyan]🌅 Morning Check-in[/bold cyan]\n")
+
+            # Check if already done today (only the columns shown below)
+            today = date.today()
+            existing = session.execute(
+                DAILY_LOG_SUMMARY, {"log_date": today.isoformat()}
+            ).first()
+
+            if existing is not None:
+                console.print("[yellow]Already checked in today![/yellow]")
+                if existing.mission:
+                    console.print(f"\nMission: {existing.mission}")
+                    console.print(f"Status: {existing.mission_status or 'in progress'}\n")
+                return
+
+            # Energy check
+            energy = ask_choice(
+                console, "Energy level", ENERGY_CHOICES, default="medium"
+            )
+
+            # Paralysis detection (simplified to single question)
             console.print(
-                Panel(
+                "\n[bold]Paralysis Check:[/bold] Physical tension OR circular thinking?"
+            )
+            paralysis = Confirm.ask("Detect any paralysis signals?", default=False)
+
+            # Answers are collected here and written once at the end
+            values = {
+                "date": today,
+                "energy": energy,
+                "paralysis_signals": paralysis,
+            }
+            partial = False
+
+            # If paralysis detected, force immediate action
+            if paralysis:
+                print_panel(
+                    console,
                     "[red bold]⚠️ PARALYSIS DETECTED[/red bold]\n\n"
                     "You must address this before continuing.\n\n"
                     "Options:\n"
@@ -67,98 +107,95 @@ def checkin():
                     title="Paralysis Protocol Required",
                     border_style="red",
                 )
-            )
 
-            action = Prompt.ask(
-                "What will you do RIGHT NOW?",
-                choices=["1", "2", "3"],
-                default="1",
-            )
+                action = ask_choice(
+                    console, "What will you do RIGHT NOW?", ACTION_CHOICES, default="1"
+                )
 
-            if action == "1":
+                if action == "1":
+                    console.print(
+                        "\n[yellow]→ Run: ceo daily decide[/yellow]"
+                        "\n[dim]After making decision, complete check-in[/dim]\n"
+                    )
+                    # Save a partial log (no mission yet)
+                    partial = True
+
+                elif action == "3":
+                    external = Prompt.ask("Who will you call?")
+                    console.print(f"\n[red]📞 Call {external} before continuing[/red]")
+                    called = Confirm.ask("Have you called them?", default=False)
+                    if not called:
+                        console.print("[red]Cannot proceed without external input[/red]")
+                        return
+
+            if not partial:
+                # Today's mission
+                console.print("\n[bold]🎯 Today's Mission[/bold]")
                 console.print(
-                    "\n[yellow]→ Run: ceo daily decide[/yellow]"
-                    "\n[dim]After making decision, complete check-in[/dim]\n"
+                    "[dim]What is the ONE thing you will SHIP today?[/dim]\n"
                 )
-                # Create partial log
-                log = DailyLog(
-                    date=today,
-                    energy=energy,
-                    paralysis_signals=True,
+                mission = Prompt.ask("Mission")
+
+                # Force definition of done
+                console.print(
+                    "\n[yellow]What does DONE look like?[/yellow]"
+                )
+                done_def = Prompt.ask(
+                    "Done when",
+                    default="Delivered / Delegated / Live",
+                )
+
+                # Time commitment
+                target_time = Prompt.ask("By what time?", default="17:00")
+
+                values.update(
+                    mission=mission,
+                    mission_done_definition=done_def,
+                    mission_target_time=target_time,
+                    mission_status=None,  # Set at EOD
                 )
-                session.add(log)
-                session.commit()
+
+            # Save check-in: one statement, one commit
+            inserted = _insert_checkin(session, **values)
+            session.commit()
+
+            if not inserted:
+                console.print("[yellow]Already checked in today![/yellow]\n")
                 return
 
-            elif action == "3":
-                external = Prompt.ask("Who will you call?")
-                console.print(f"\n[red]📞 Call {external} before continuing[/red]")
-                called = Confirm.ask("Have you called them?", default=False)
-                if not called:
-                    console.print("[red]Cannot proceed without external input[/red]")
-                    return
+            if partial:
+                return
 
-        # Today's mission
-        console.print("\n[bold]🎯 Today's Mission[/bold]")
-        console.print(
-            "[dim]What is the ONE thing you will SHIP today?[/dim]\n"
-        )
-        mission = Prompt.ask("Mission")
-
-        # Force definition of done
-        console.print(
-            "\n[yellow]What does DONE look like?[/yellow]"
-        )
-        done_def = Prompt.ask(
-            "Done when",
-            default="Delivered / Delegated / Live",
-        )
-
-        # Time commitment
-        target_time = Prompt.ask("By what time?", default="17:00")
-
-        # Save check-in
-        log = DailyLog(
-            date=today,
-            energy=energy,
-            paralysis_signals=paralysis,
-            mission=mission,
-            mission_done_definition=done_def,
-            mission_target_time=target_time,
-            mission_status=None,  # Set at EOD
-        )
-
-        session.add(log)
-        session.commit()
-
-        # Show confirmation
-        console.print("\n[green bold]✓ Check-in complete[/green bold]\n")
-        console.print(f"Mission: {mission}")
-        console.print(f"Done when: {done_def}")
-        console.print(f"Target: {target_time}\n")
-
-        # Check circuit breaker
-        should_trigger, reasons = check_circuit_breaker_conditions(session)
-        if should_trigger:
+            # Show confirmation
             console.print(
-                Panel(
+                "\n[green bold]✓ Check-in complete[/green bold]\n\n"
+                f"Mission: {mission}\n"
+                f"Done when: {done_def}\n"
+                f"Target: {target_time}\n"
+            )
+
+            # Check circuit breaker (sees the answers just committed)
+            should_trigger, reasons = check_circuit_breaker_conditions(
+                session, today=today
+            )
+
+            if should_trigger:
+                print_panel(
+                    console,
                     "[red bold]🚨 CIRCUIT BREAKER CONDITIONS MET[/red bold]\n\n"
                     + "\n".join(f"  • {r}" for r in reasons)
                     + "\n\nRun: [cyan]ceo emergency activate[/cyan]",
                     title="System Override Recommended",
                     border_style="red",
                 )
-            )
 
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Check-in cancelled[/yellow]")
-        session.rollback()
-    except Exception as e:
-        console.print(f"\n[red]Error: {e}[/red]")
-        session.rollback()
-        raise
-    finally:
-        session.close()
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Check-in cancelled[/yellow]")
+            session.rollback()
+        except Exception as e:
+            console.print(f"\n[red]Error: {e}[/red]")
+            session.rollback()
+            raise
 
 
 @app.command()
@@ -175,37 +212,43 @@ def complete(
 
     Status options: shipped, blocked, deferred
     """
-    session = get_session()
-
-    try:
-        today = date.today()
-        log = session.query(DailyLog).filter(DailyLog.date == today).first()
-
-        if not log:
-            console.print("[red]No check-in found for today[/red]")
-            console.print("[yellow]Run: ceo daily checkin[/yellow]")
-            return
-
-        if not log.mission:
-            console.print("[red]No mission set for today[/red]")
-            return
-
-        # Validate status
-        valid_statuses = ["shipped", "blocked", "deferred"]
-        if status.lower() not in valid_statuses:
-            console.print(f"[red]Invalid status. Use: {', '.join(valid_statuses)}[/red]")
-            return
-
-        log.mission_status = status.lower()
-
-        # If blocked, get details
-        if status.lower() == "blocked":
-            blocker = Prompt.ask(
-                "What's blocking?",
-                choices=["me_decision", "external", "other"],
-                default="me_decision",
-            )
-            log.blocker_type = blocker
+    from src.core.database import COMPLETE_MISSION, DAILY_LOG_SUMMARY, scoped_session
+
+    with scoped_session() as session:
+        try:
+            status = status.lower()
+
+            # Validate status
+            if status not in VALID_STATUSES:
+                console.print(f"[red]Invalid status. Use: {', '.join(STATUS_CHOICES)}[/red]")
+                return
+
+            today = {"log_date": date.today().isoformat()}
+
+            # If blocked, get details (only once we know there is a mission)
+            blocker = None
+            if status == "blocked":
+                if _report_missing_mission(
+                    session.execute(DAILY_LOG_SUMMARY, today).first()
+                ):
+                    return
+                blocker = ask_choice(
+                    console, "What's blocking?", BLOCKER_CHOICES, default="me_decision"
+                )
+
+            # Update today's log in one statement; only diagnose on a miss
+            mission = session.execute(
+                COMPLETE_MISSION, {**today, "status": status, "blocker": blocker}
+            ).scalar()
+
+            if mission is None:
+                session.rollback()
+                _report_missing_mission(
+                    session.execute(DAILY_LOG_SUMMARY, today).first()
+                )
+                return
+
+            session.commit()
 
             if blocker == "me_decision":
                 console.print(
@@ -213,25 +256,21 @@ def complete(
                     "→ Run: [cyan]ceo daily decide[/cyan] (20-min protocol)\n"
                 )
 
-        # If shipped, celebrate
-        if status.lower() == "shipped":
-            console.print("\n[green bold]🎉 MISSION SHIPPED![/green bold]\n")
-            console.print(
-                "[dim]Every completion rewires your brain toward shipping.[/dim]\n"
-            )
-
-        session.commit()
+            # If shipped, celebrate
+            if status == "shipped":
+                console.print("\n[green bold]🎉 MISSION SHIPPED![/green bold]\n")
+                console.print(
+                    "[dim]Every completion rewires your brain toward shipping.[/dim]\n"
+                )
 
-        # Show updated status
-        console.print(f"Mission: {log.mission}")
-        console.print(f"Status: [bold]{log.mission_status}[/bold]\n")
+            # Show updated status
+            console.print(f"Mission: {mission}")
+            console.print(f"Status: [bold]{status}[/bold]\n")
 
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        session.rollback()
-        raise
-    finally:
-        session.close()
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            session.rollback()
+            raise
 
 
 @app.command()
@@ -257,93 +296,81 @@ def decide():
 @app.command()
 def show():
     """Show today's dashboard."""
-    session = get_session()
-
-    try:
-        today = date.today()
-        log = session.query(DailyLog).filter(DailyLog.date == today).first()
-
-        if not log:
-            console.print("[yellow]No check-in today[/yellow]")
-            console.print("\nRun: [cyan]ceo daily checkin[/cyan]\n")
-            return
-
-        # Show today's status
-        console.print("\n[bold cyan]Today's Dashboard[/bold cyan]\n")
-
-        console.print(f"Energy: {log.energy or 'not set'}")
-        console.print(
-            f"Paralysis: {'[red]YES[/red]' if log.paralysis_signals else '[green]NO[/green]'}"
-        )
-        console.print(f"\nMission: {log.mission or 'not set'}")
-
-        if log.mission_done_definition:
-            console.print(f"Done when: {log.mission_done_definition}")
-
-        if log.mission_target_time:
-            console.print(f"Target: {log.mission_target_time}")
-
-        if log.mission_status:
-            status_color = (
-                "green"
-                if log.mission_status == "shipped"
-                else "red"
-                if log.mission_status == "blocked"
-                else "yellow"
-            )
-            console.print(f"Status: [{status_color}]{log.mission_status}[/{status_color}]")
+    # Pure read: skip the ORM
+    with fastread.connect() as conn:
+        log = fastread.get_daily_log(conn, date.today())
+
+    if not log:
+        console.print("[yellow]No check-in today[/yellow]")
+        console.print("\nRun: [cyan]ceo daily checkin[/cyan]\n")
+        return
+
+    # Show today's status
+    lines = [
+        "\n[bold cyan]Today's Dashboard[/bold cyan]\n",
+        f"Energy: {log['energy'] or 'not set'}",
+        f"Paralysis: {'[red]YES[/red]' if log['paralysis_signals'] else '[green]NO[/green]'}",
+        f"\nMission: {log['mission'] or 'not set'}",
+    ]
 
-        console.print()
+    if log["mission_done_definition"]:
+        lines.append(f"Done when: {log['mission_done_definition']}")
 
-    finally:
-        session.close()
+    if log["mission_target_time"]:
+        lines.append(f"Target: {log['mission_target_time']}")
+
+    if log["mission_status"]:
+        status_color = STATUS_COLORS.get(log["mission_status"], "yellow")
+        lines.append(f"Status: [{status_color}]{log['mission_status']}[/{status_color}]")
+
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 @app.command()
 def reset():
     """Delete today's check-in and start fresh."""
-    session = get_session()
-
-    try:
-        today = date.today()
-        log = session.query(DailyLog).filter(DailyLog.date == today).first()
-
-        if not log:
-            console.print("[yellow]No check-in found for today[/yellow]")
-            console.print("\nNothing to reset. Run: [cyan]ceo daily checkin[/cyan]\n")
-            return
-
-        # Show what will be deleted
-        console.print("\n[bold yellow]⚠️  Reset Today's Check-in[/bold yellow]\n")
-        console.print("This will delete:")
-        if log.mission:
-            console.print(f"  • Mission: {log.mission}")
-        if log.energy:
-            console.print(f"  • Energy: {log.energy}")
-        if log.mission_status:
-            console.print(f"  • Status: {log.mission_status}")
-        console.print()
-
-        # Confirm deletion
-        confirm = Confirm.ask(
-            "[red]Are you sure you want to delete today's entry?[/red]",
-            default=False,
-        )
-
-        if not confirm:
-            console.print("\n[yellow]Reset cancelled[/yellow]\n")
-            return
-
-        # Delete the entry
-        session.delete(log)
-        session.commit()
-
-        console.print("\n[green]✓ Today's entry deleted[/green]")
-        console.print("\nYou can now run: [cyan]ceo daily checkin[/cyan] to start fresh\n")
-
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    from src.core.database import get_daily_log_by_date, scoped_session
+
+    with scoped_session() as session:
+        try:
+            today = date.today()
+            log = get_daily_log_by_date(session, today)
+
+            if not log:
+                console.print("[yellow]No check-in found for today[/yellow]")
+                console.print("\nNothing to reset. Run: [cyan]ceo daily checkin[/cyan]\n")
+                return
+
+            # Show what will be deleted
+            console.print("\n[bold yellow]⚠️  Reset Today's Check-in[/bold yellow]\n")
+            console.print("This will delete:")
+            if log.mission:
+                console.print(f"  • Mission: {log.mission}")
+            if log.energy:
+                console.print(f"  • Energy: {log.energy}")
+            if log.mission_status:
+                console.print(f"  • Status: {log.mission_status}")
+            console.print()
+
+            # Confirm deletion
+            confirm = Confirm.ask(
+                "[red]Are you sure you want to delete today's entry?[/red]",
+                default=False,
+            )
+
+            if not confirm:
+                console.print("\n[yellow]Reset cancelled[/yellow]\n")
+                return
+
+            # Delete the entry
+            session.delete(log)
+            session.commit()
+
+            console.print("\n[green]✓ Today's entry deleted[/green]")
+            console.print("\nYou can now run: [cyan]ceo daily checkin[/cyan] to start fresh\n")
+
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            session.rollback()
+            raise
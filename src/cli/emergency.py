@@ -5,19 +5,20 @@ For when things are overwhelming.
 """
 
 import typer
-from rich.console import Console
 
+from src.cli.output import make_console
 from src.protocols.circuit import (
     activate_circuit_breaker,
     check_and_warn,
     deactivate_circuit_breaker,
     is_circuit_breaker_active,
+    read_circuit_breaker_config,
 )
 from src.core.metrics import check_circuit_breaker_conditions
-from src.core.database import get_session
+from src.core.database import scoped_session
 
-app = typer.Typer(help="Emergency & circuit breaker commands")
-console = Console()
+app = typer.Typer(help="Emergency & circuit breaker commands", add_completion=False)
+console = make_console()
 
 
 @app.command()
@@ -41,9 +42,7 @@ def activate():
         console.print("[yellow]Circuit breaker already active[/yellow]\n")
         return
 
-    session = get_session()
-
-    try:
+    with scoped_session() as session:
         # Check if conditions are met
         should_trigger, reasons = check_circuit_breaker_conditions(session)
 
@@ -55,9 +54,6 @@ def activate():
 
         activate_circuit_breaker(reasons)
 
-    finally:
-        session.close()
-
 
 @app.command()
 def deactivate():
@@ -68,22 +64,18 @@ def deactivate():
 @app.command()
 def status():
     """Show circuit breaker status."""
-    if not is_circuit_breaker_active():
+    # One stat + (cached) read instead of exists() followed by read_text()
+    config = read_circuit_breaker_config()
+
+    if config is None:
         console.print("[green]Circuit breaker: INACTIVE[/green]")
         console.print("[dim]Normal operations[/dim]\n")
         return
 
     console.print("[yellow bold]Circuit breaker: ACTIVE[/yellow bold]\n")
 
-    # Read config
-    from pathlib import Path
-
-    flag_file = Path.home() / ".ceo-os" / ".circuit_breaker_active"
-
-    if flag_file.exists():
-        config = flag_file.read_text()
-        console.print("[bold]Simplified Mode Active:[/bold]")
-        console.print(config)
-        console.print()
+    console.print("[bold]Simplified Mode Active:[/bold]")
+    console.print(config)
+    console.print()
 
     console.print("[dim]Run: ceo emergency deactivate (when ready)[/dim]\n")
@@ -4,73 +4,133 @@ CEO Execution OS - Main CLI entry point.
 Simple, fast, focused on forcing behavior change.
 """
 
+import importlib
+import sys
+from datetime import date
+from typing import List, Optional
+
 import typer
-from rich.console import Console
-from rich.panel import Panel
-
-from src.core.database import init_database, get_db_path, get_session
-from src.core.metrics import (
-    get_today_status,
-    get_week_stats,
-    get_hours_until_eod,
-)
+from typer.core import TyperGroup
+
+from src.cli.output import make_console
+
+# Subcommand groups, imported only when a command line resolves to them
+SUBCOMMANDS = {
+    "daily": "Daily execution commands",
+    "project": "Project management commands",
+    "emergency": "Emergency & circuit breaker commands",
+}
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that imports a subcommand module on first use.
+
+    Help listings get a placeholder carrying the group's one-line help,
+    so `ceo --help` imports none of them; resolving a command line
+    (`ceo daily show`) imports just the group it names.
+    """
+
+    def list_commands(self, ctx) -> List[str]:
+        return super().list_commands(ctx) + [
+            name for name in SUBCOMMANDS if name not in self.commands
+        ]
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in SUBCOMMANDS:
+            return TyperGroup(name=cmd_name, help=SUBCOMMANDS[cmd_name])
+        return command
+
+    def resolve_command(self, ctx, args):
+        cmd_name = args[0] if args else None
+        if cmd_name in SUBCOMMANDS and cmd_name not in self.commands:
+            module = importlib.import_module(f"src.cli.{cmd_name}")
+            command = typer.main.get_command(module.app)
+            command.name = cmd_name
+            self.add_command(command)
+        return super().resolve_command(ctx, args)
+
 
 app = typer.Typer(
     name="ceo",
     help="CEO Execution OS - Anti-paralysis execution system",
     add_completion=False,
+    cls=LazyGroup,
 )
-console = Console()
+console = make_console()
+
+# Database/metrics imports are deferred into the commands so that help
+# output never pays for SQLAlchemy and model setup.
+HEADER_SKIP_COMMANDS = frozenset({"setup"})
+HELP_FLAGS = frozenset({"--help", "-h"})
+
+
+def load_dashboard_snapshot(today: Optional[date] = None):
+    """Read the dashboard snapshot in one round trip (no ORM)."""
+    from src.core import fastread
 
+    with fastread.connect() as conn:
+        return fastread.get_dashboard_snapshot(conn, today=today)
 
-def show_status_header():
+
+def show_status_header(snapshot):
     """Show completion status on every command.
 
     Makes progress (or lack thereof) constantly visible.
     """
-    session = get_session()
-    try:
-        today = get_today_status(session)
-        week_stats = get_week_stats(session)
+    from src.core.dashboard import get_hours_until_eod
 
-        # Today's status
-        if today and today.mission:
-            if today.mission_status == "shipped":
-                console.print("[green]✓ Today's mission: SHIPPED[/green]")
-            else:
-                hours_left = get_hours_until_eod()
-                console.print(
-                    f"[yellow]⏱ Today's mission: {hours_left}h remaining[/yellow]"
-                )
-                console.print(f"[dim]Mission: {today.mission}[/dim]")
+    week_stats = snapshot.week
+
+    # Collect the header and write it in one go
+    lines = []
+
+    # Today's status
+    if snapshot.today_mission:
+        if snapshot.today_mission_status == "shipped":
+            lines.append("[green]✓ Today's mission: SHIPPED[/green]")
         else:
-            console.print("[red]❌ No check-in today[/red]")
+            hours_left = get_hours_until_eod()
+            lines.append(
+                f"[yellow]⏱ Today's mission: {hours_left}h remaining[/yellow]"
+            )
+            lines.append(f"[dim]Mission: {snapshot.today_mission}[/dim]")
+    else:
+        lines.append("[red]❌ No check-in today[/red]")
 
-        # Weekly progress
-        shipped = week_stats["shipped"]
-        total = week_stats["total"]
-        rate = week_stats["completion_rate"]
-        trend = "↑" if week_stats["improving"] else "↓"
+    # Weekly progress
+    shipped = week_stats["shipped"]
+    total = week_stats["total"]
+    rate = week_stats["completion_rate"]
+    trend = "↑" if week_stats["improving"] else "↓"
 
-        console.print(f"This week: {shipped}/{total} shipped ({trend})")
+    lines.append(f"This week: {shipped}/{total} shipped ({trend})")
 
-        # Completion rate with color
-        color = "green" if rate >= 80 else "yellow" if rate >= 60 else "red"
-        console.print(f"[{color}]Completion rate: {rate:.0f}%[/{color}] (target: 80%)\n")
+    # Completion rate with color
+    color = "green" if rate >= 80 else "yellow" if rate >= 60 else "red"
+    lines.append(f"[{color}]Completion rate: {rate:.0f}%[/{color}] (target: 80%)\n")
 
-    finally:
-        session.close()
+    console.print("\n".join(lines))
 
 
 @app.callback()
-def callback():
+def callback(ctx: typer.Context):
     """Show status header before every command."""
-    # Skip header for setup command
-    import sys
-
-    if len(sys.argv) > 1 and sys.argv[1] not in ["setup", "--help", "-h"]:
+    # Skip header for setup and for any help request
+    args = sys.argv[1:]
+    if (
+        args
+        and args[0] not in HEADER_SKIP_COMMANDS
+        and HELP_FLAGS.isdisjoint(args)
+    ):
+        # The header is a raw sqlite3 read; no ORM session is opened here,
+        # commands that write open (and share) their own scoped_session()
         try:
-            show_status_header()
+            # Commands that need the dashboard (status) reuse it, and the
+            # date it was read for, via ctx.obj
+            today = date.today()
+            ctx.obj = (today, load_dashboard_snapshot(today))
+            show_status_header(ctx.obj[1])
         except Exception:
             # DB might not be initialized yet
             pass
@@ -79,6 +139,8 @@ def callback():
 @app.command()
 def setup():
     """Initialize the CEO Execution OS database."""
+    from src.core.database import get_db_path, init_database
+
     console.print("\n[bold cyan]🚀 CEO Execution OS Setup[/bold cyan]\n")
 
     try:
@@ -100,47 +162,39 @@ def setup():
 
 
 @app.command()
-def status():
+def status(ctx: typer.Context):
     """Show current status and metrics."""
     # Status header already shown by callback, just show additional details
-    session = get_session()
-    try:
-        from src.core.metrics import get_active_projects, get_paralysis_rate
-
-        # Active projects
-        projects = get_active_projects(session)
-        console.print(f"\n[bold]Active Projects ({len(projects)}/3):[/bold]")
-        if projects:
-            for p in projects:
-                days_left = p.days_remaining
-                if days_left is not None:
-                    console.print(f"  • {p.name} ({days_left} days)")
-                else:
-                    console.print(f"  • {p.name} (no deadline)")
-        else:
-            console.print("  [dim]No active projects[/dim]")
-
-        # Paralysis rate
-        paralysis = get_paralysis_rate(session, days=30)
-        rate = paralysis["paralysis_rate"]
-        color = "green" if rate < 20 else "yellow" if rate < 40 else "red"
-        console.print(
-            f"\n[bold]Paralysis Rate (30 days):[/bold] "
-            f"[{color}]{rate:.0f}%[/{color}] "
-            f"({paralysis['paralysis_days']}/{paralysis['total_days']} days)\n"
-        )
-
-    finally:
-        session.close()
-
-
-# Import subcommands
-from src.cli import daily, project, emergency  # noqa: E402
-
-# Register subcommands
-app.add_typer(daily.app, name="daily")
-app.add_typer(project.app, name="project")
-app.add_typer(emergency.app, name="emergency")
+    from src.core.dashboard import days_until
+
+    if ctx.obj:
+        today, snapshot = ctx.obj
+    else:
+        today = date.today()
+        snapshot = load_dashboard_snapshot(today)
+
+    # Active projects
+    projects = snapshot.active_projects
+    console.print(f"\n[bold]Active Projects ({len(projects)}/3):[/bold]")
+    if projects:
+        for name, target_date in projects:
+            if target_date is not None:
+                days_left = days_until(target_date, today)
+                console.print(f"  • {name} ({days_left} days)")
+            else:
+                console.print(f"  • {name} (no deadline)")
+    else:
+        console.print("  [dim]No active projects[/dim]")
+
+    # Paralysis rate
+    paralysis = snapshot.paralysis
+    rate = paralysis["paralysis_rate"]
+    color = "green" if rate < 20 else "yellow" if rate < 40 else "red"
+    console.print(
+        f"\n[bold]Paralysis Rate (30 days):[/bold] "
+        f"[{color}]{rate:.0f}%[/{color}] "
+        f"({paralysis['paralysis_days']}/{paralysis['total_days']} days)\n"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+"""
+Console output helpers shared by the CLI commands.
+
+Panels and tables are only drawn on a real terminal. Piped / scripted
+output gets the same text without the box-drawing render pass.
+"""
+
+import sys
+from typing import Tuple
+
+from rich.console import Console
+from rich.prompt import Prompt
+
+
+def make_console() -> Console:
+    """Create a console tuned for a short-lived CLI process."""
+    return Console(
+        highlight=False,
+        markup=True,
+        emoji=False,
+        no_color=not sys.stdout.isatty(),
+    )
+
+
+def print_panel(console: Console, body: str, *, title: str, border_style: str) -> None:
+    """Print a bordered panel, or plain text when not on a terminal."""
+    if console.is_terminal:
+        from rich.panel import Panel
+
+        console.print(Panel(body, title=title, border_style=border_style))
+    else:
+        console.print(f"{title}\n{body}")
+
+
+def ask_choice(
+    console: Console, prompt: str, choices: Tuple[str, ...], *, default: str
+) -> str:
+    """Ask for one of a fixed set of answers.
+
+    Interactive runs get the usual rich prompt. Scripted runs (stdin not
+    a terminal) read one line per attempt; a blank line or end of input
+    picks the default.
+    """
+    if sys.stdin.isatty():
+        return Prompt.ask(prompt, choices=choices, default=default, console=console)
+
+    valid = frozenset(choices)
+    question = f"{prompt} [{'/'.join(choices)}] ({default}): "
+    while True:
+        console.print(question, end="", markup=False)
+        line = sys.stdin.readline()
+        answer = line.strip() or default
+        if answer in valid:
+            return answer
+        if not line:
+            return default
+        console.print(
+            f"Please select one of the available options: {', '.join(choices)}",
+            markup=False,
+        )
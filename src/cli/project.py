@@ -7,31 +7,32 @@ Forces prioritization and prevents WIP buildup.
 from datetime import date, datetime
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
+from rich.console import Group
 from rich.prompt import Confirm, Prompt
-from rich.table import Table
+from sqlalchemy import select
 
-from src.core.database import get_session
-from src.core.metrics import can_add_project, get_active_projects
+from src.cli.output import make_console, print_panel
+from src.core.dashboard import days_until
+from src.core.database import get_project_by_id_prefix, scoped_session
+from src.core.metrics import count_active_projects, get_project_slots
 from src.core.models import Project
 
-app = typer.Typer(help="Project management commands")
-console = Console()
+app = typer.Typer(help="Project management commands", add_completion=False)
+console = make_console()
+
+STATUS_STYLE = {"active": "yellow", "shipped": "green", "killed": "red"}
 
 
 @app.command()
 def add(name: str = typer.Argument(..., help="Project name")):
     """Add a new project (HARD CAP: 3 active max)."""
-    session = get_session()
-
-    try:
-        # Check hard cap
-        if not can_add_project(session):
-            active = get_active_projects(session)
-
-            console.print(
-                Panel(
+    with scoped_session() as session:
+        try:
+            # Check hard cap (the same list is reused for the final count)
+            active, has_slot = get_project_slots(session)
+            if not has_slot:
+                print_panel(
+                    console,
                     "[red bold]❌ CANNOT ADD PROJECT[/red bold]\n\n"
                     f"Already at 3 active projects (hard cap).\n\n"
                     "[bold]Your active projects:[/bold]\n"
@@ -43,153 +44,168 @@ def add(name: str = typer.Argument(..., help="Project name")):
                     title="Hard Cap Reached",
                     border_style="red",
                 )
-            )
-            raise typer.Exit(1)
-
-        # Get target date
-        has_deadline = Confirm.ask("Set target ship date?", default=True)
-        target = None
-
-        if has_deadline:
-            date_str = Prompt.ask("Target date (YYYY-MM-DD)")
-            try:
-                target = datetime.strptime(date_str, "%Y-%m-%d").date()
-            except ValueError:
-                console.print("[red]Invalid date format[/red]")
                 raise typer.Exit(1)
 
-        # Create project
-        project = Project(
-            name=name,
-            target_date=target,
-            status="active",
-        )
+            # Get target date
+            has_deadline = Confirm.ask("Set target ship date?", default=True)
+            target = None
+
+            if has_deadline:
+                date_str = Prompt.ask("Target date (YYYY-MM-DD)")
+                try:
+                    target = datetime.strptime(date_str, "%Y-%m-%d").date()
+                except ValueError:
+                    console.print("[red]Invalid date format[/red]")
+                    raise typer.Exit(1)
+
+            # Create project
+            project = Project(
+                name=name,
+                target_date=target,
+                status="active",
+            )
 
-        session.add(project)
-        session.commit()
+            session.add(project)
+            session.commit()
 
-        console.print(f"\n[green]✓ Project added:[/green] {name}")
-        if target:
-            days_until = (target - date.today()).days
-            console.print(f"[dim]Target: {target} ({days_until} days)[/dim]")
+            console.print(f"\n[green]✓ Project added:[/green] {name}")
+            if target:
+                days_left = days_until(target, date.today())
+                console.print(f"[dim]Target: {target} ({days_left} days)[/dim]")
 
-        console.print(
-            f"\n[yellow]Active projects: {len(get_active_projects(session))}/3[/yellow]\n"
-        )
+            console.print(
+                f"\n[yellow]Active projects: {len(active) + 1}/3[/yellow]\n"
+            )
 
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        session.rollback()
-        raise
-    finally:
-        session.close()
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            session.rollback()
+            raise
 
 
 @app.command()
 def list(show_all: bool = typer.Option(False, "--all", help="Show all projects")):
     """List projects."""
-    session = get_session()
-
-    try:
+    with scoped_session() as session:
+        # Only the columns the table shows - no full entity hydration
+        stmt = select(Project.id, Project.name, Project.status, Project.target_date)
         if show_all:
-            projects = session.query(Project).order_by(Project.created_at.desc()).all()
+            stmt = stmt.order_by(Project.created_at.desc())
         else:
-            projects = get_active_projects(session)
+            stmt = stmt.where(Project.status == "active")
+        projects = session.execute(stmt).all()
 
         if not projects:
             console.print("[yellow]No projects found[/yellow]\n")
             return
 
-        # Create table
-        table = Table(title="Projects" if show_all else "Active Projects (Max 3)")
-        table.add_column("ID", style="dim")
-        table.add_column("Name", style="cyan")
-        table.add_column("Status")
-        table.add_column("Target Date")
-        table.add_column("Days Left")
+        today = date.today()
+        title = "Projects" if show_all else "Active Projects (Max 3)"
+        columns = ("ID", "Name", "Status", "Target Date", "Days Left")
+        rows = []
 
         for p in projects:
-            status_style = {
-                "active": "yellow",
-                "shipped": "green",
-                "killed": "red",
-            }.get(p.status, "white")
-
-            days_left = p.days_remaining
-            days_str = (
-                f"{days_left}d"
-                if days_left is not None
-                else "-"
+            days_left = days_until(p.target_date, today)
+            if days_left is None:
+                days_str = "-"
+            elif days_left < 0:
+                days_str = f"{days_left}d (overdue)"
+            else:
+                days_str = f"{days_left}d"
+
+            rows.append(
+                (
+                    p.id[:8],
+                    p.name,
+                    p.status,
+                    str(p.target_date) if p.target_date else "-",
+                    days_str,
+                )
             )
 
-            if days_left is not None and days_left < 0:
-                days_str = f"[red]{days_left}d (overdue)[/red]"
-
-            table.add_row(
-                p.id[:8],
-                p.name,
-                f"[{status_style}]{p.status}[/{status_style}]",
-                str(p.target_date) if p.target_date else "-",
-                days_str,
+        if console.is_terminal:
+            from rich.table import Table
+
+            table = Table(title=title)
+            table.add_column("ID", style="dim")
+            table.add_column("Name", style="cyan")
+            table.add_column("Status")
+            table.add_column("Target Date")
+            table.add_column("Days Left")
+            for short_id, name, status, target, days_str in rows:
+                status_style = STATUS_STYLE.get(status, "white")
+                if days_str.endswith("(overdue)"):
+                    days_str = f"[red]{days_str}[/red]"
+                table.add_row(
+                    short_id,
+                    name,
+                    f"[{status_style}]{status}[/{status_style}]",
+                    target,
+                    days_str,
+                )
+            output = [table, ""]
+        else:
+            # Plain tab-separated rows for scripts; bypasses rich, which
+            # would expand the tabs to spaces
+            typer.echo(
+                "\n".join(
+                    [title, "\t".join(columns)] + ["\t".join(row) for row in rows]
+                )
+                + "\n"
             )
-
-        console.print(table)
-        console.print()
+            output = []
 
         # Show cap status for active projects
         if not show_all:
             active_count = len(projects)
             color = "red" if active_count >= 3 else "yellow" if active_count == 2 else "green"
-            console.print(
+            output.append(
                 f"[{color}]Active: {active_count}/3[/{color}] "
                 f"({'at cap' if active_count >= 3 else f'{3-active_count} slots left'})\n"
             )
 
-    finally:
-        session.close()
+        if output:
+            console.print(Group(*output))
 
 
 @app.command()
 def complete(project_id: str = typer.Argument(..., help="Project ID (first 8 chars)")):
     """Mark project as shipped."""
-    session = get_session()
-
-    try:
-        # Find project by ID prefix
-        project = (
-            session.query(Project)
-            .filter(Project.id.like(f"{project_id}%"))
-            .first()
-        )
+    with scoped_session() as session:
+        try:
+            # Find project by ID prefix
+            project = get_project_by_id_prefix(session, project_id)
 
-        if not project:
-            console.print(f"[red]Project not found: {project_id}[/red]")
-            raise typer.Exit(1)
+            if not project:
+                console.print(f"[red]Project not found: {project_id}[/red]")
+                raise typer.Exit(1)
 
-        if project.status != "active":
-            console.print(
-                f"[yellow]Project already {project.status}[/yellow]"
-            )
-            return
+            if project.status != "active":
+                console.print(
+                    f"[yellow]Project already {project.status}[/yellow]"
+                )
+                return
 
-        # Check if shipped early
-        shipped_early = False
-        if project.target_date:
-            shipped_early = date.today() <= project.target_date
+            # Check if shipped early
+            today = date.today()
+            shipped_early = False
+            if project.target_date:
+                shipped_early = today <= project.target_date
 
-        project.status = "shipped"
-        project.completed_at = datetime.now()
-        project.shipped_early = shipped_early
+            project.status = "shipped"
+            project.completed_at = datetime.now()
+            project.shipped_early = shipped_early
 
-        session.commit()
+            session.commit()
 
-        # Celebrate
-        console.print(
-            Panel(
+            # Celebrate
+            print_panel(
+                console,
                 f"[green bold]🎉 PROJECT SHIPPED![/green bold]\n\n"
                 f"Project: {project.name}\n"
                 + (
-                    f"[green]✓ SHIPPED EARLY[/green] (by {abs((project.target_date - date.today()).days)} days)\n"
+                    f"[green]✓ SHIPPED EARLY[/green] "
+                    f"(by {abs(days_until(project.target_date, today))} days)\n"
                     if shipped_early and project.target_date
                     else ""
                 )
@@ -197,84 +213,68 @@ def complete(project_id: str = typer.Argument(..., help="Project ID (first 8 cha
                 title="Completion",
                 border_style="green",
             )
-        )
 
-        active_count = len(get_active_projects(session))
-        console.print(
-            f"\n[yellow]Active projects: {active_count}/3[/yellow] "
-            f"({3-active_count} slots available)\n"
-        )
+            active_count = count_active_projects(session)
+            console.print(
+                f"\n[yellow]Active projects: {active_count}/3[/yellow] "
+                f"({3-active_count} slots available)\n"
+            )
 
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        session.rollback()
-        raise
-    finally:
-        session.close()
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            session.rollback()
+            raise
 
 
 @app.command()
 def kill(project_id: str = typer.Argument(..., help="Project ID")):
     """Kill a project (stop pursuing)."""
-    session = get_session()
+    with scoped_session() as session:
+        try:
+            project = get_project_by_id_prefix(session, project_id)
 
-    try:
-        project = (
-            session.query(Project)
-            .filter(Project.id.like(f"{project_id}%"))
-            .first()
-        )
+            if not project:
+                console.print(f"[red]Project not found: {project_id}[/red]")
+                raise typer.Exit(1)
 
-        if not project:
-            console.print(f"[red]Project not found: {project_id}[/red]")
-            raise typer.Exit(1)
+            console.print(f"\n[yellow]Kill project:[/yellow] {project.name}")
 
-        console.print(f"\n[yellow]Kill project:[/yellow] {project.name}")
+            reason = Prompt.ask("Why kill this project?", default="No longer strategic")
 
-        reason = Prompt.ask("Why kill this project?", default="No longer strategic")
+            confirm = Confirm.ask(
+                "Are you sure? This frees up a project slot",
+                default=False,
+            )
 
-        confirm = Confirm.ask(
-            "Are you sure? This frees up a project slot",
-            default=False,
-        )
+            if not confirm:
+                console.print("[yellow]Cancelled[/yellow]")
+                return
 
-        if not confirm:
-            console.print("[yellow]Cancelled[/yellow]")
-            return
+            project.status = "killed"
+            project.completed_at = datetime.now()
 
-        project.status = "killed"
-        project.completed_at = datetime.now()
+            session.commit()
 
-        session.commit()
+            console.print(f"\n[red]✓ Project killed:[/red] {project.name}")
+            console.print(f"[dim]Reason: {reason}[/dim]")
 
-        console.print(f"\n[red]✓ Project killed:[/red] {project.name}")
-        console.print(f"[dim]Reason: {reason}[/dim]")
-
-        active_count = len(get_active_projects(session))
-        console.print(
-            f"\n[green]Active projects: {active_count}/3[/green] "
-            f"(slot freed up)\n"
-        )
+            active_count = count_active_projects(session)
+            console.print(
+                f"\n[green]Active projects: {active_count}/3[/green] "
+                f"(slot freed up)\n"
+            )
 
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        session.rollback()
-        raise
-    finally:
-        session.close()
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            session.rollback()
+            raise
 
 
 @app.command()
 def status(project_id: str = typer.Argument(..., help="Project ID")):
     """Show project details."""
-    session = get_session()
-
-    try:
-        project = (
-            session.query(Project)
-            .filter(Project.id.like(f"{project_id}%"))
-            .first()
-        )
+    with scoped_session() as session:
+        project = get_project_by_id_prefix(session, project_id)
 
         if not project:
             console.print(f"[red]Project not found: {project_id}[/red]")
@@ -301,6 +301,3 @@ def status(project_id: str = typer.Argument(..., help="Project ID")):
                 console.print(f"Result: {result}")
 
         console.print()
-
-    finally:
-        session.close()
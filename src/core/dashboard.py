@@ -0,0 +1,155 @@
+"""
+Dashboard query and the date helpers it is built from.
+
+Plain SQL text and Python only - no SQLAlchemy, no models - so the raw
+sqlite3 read path (src.core.fastread) and the status header load fast.
+src.core.metrics runs the same SQL through an ORM session.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+@lru_cache(maxsize=8)
+def _week_start_of(target_date: date) -> date:
+    """Get Monday of the week containing target_date (memoized)."""
+    # Get Monday (weekday 0)
+    days_since_monday = target_date.weekday()
+    return target_date - timedelta(days=days_since_monday)
+
+
+def get_week_start(target_date: Optional[date] = None) -> date:
+    """Get Monday of the current week."""
+    return _week_start_of(target_date or date.today())
+
+
+def days_until(target_date: Optional[date], today: date) -> Optional[int]:
+    """Days from `today` until `target_date` (None without a target)."""
+    return (target_date - today).days if target_date else None
+
+
+def paralysis_stats(paralysis_days: int, total_days: int) -> Dict:
+    """Build the paralysis stats dict from raw counts."""
+    rate = (paralysis_days / total_days * 100) if total_days > 0 else 0
+
+    return {
+        "paralysis_days": paralysis_days,
+        "total_days": total_days,
+        "paralysis_rate": rate,
+        "recent_episodes": paralysis_days,  # For circuit breaker
+    }
+
+
+@dataclass
+class DashboardSnapshot:
+    """Everything the status header and `ceo status` show, read in one query.
+
+    `week` and `paralysis` have the same shape as get_week_stats() and
+    get_paralysis_rate(); `active_projects` holds (name, target_date) pairs.
+    """
+
+    today_mission: Optional[str]
+    today_mission_status: Optional[str]
+    week: Dict
+    paralysis: Dict
+    active_projects: List[Tuple[str, Optional[date]]]
+
+
+# This week's and last week's mission counts, shared by the dashboard and
+# the circuit breaker (binds :week_start, :prev_week_start, :week_end)
+WEEKS_CTE = """
+weeks AS (
+    SELECT
+        SUM(CASE WHEN date >= :week_start AND mission IS NOT NULL
+            THEN 1 ELSE 0 END) AS week_total,
+        SUM(CASE WHEN date >= :week_start AND mission_status = 'shipped'
+            THEN 1 ELSE 0 END) AS week_shipped,
+        SUM(CASE WHEN date < :week_start AND mission IS NOT NULL
+            THEN 1 ELSE 0 END) AS prev_total,
+        SUM(CASE WHEN date < :week_start AND mission_status = 'shipped'
+            THEN 1 ELSE 0 END) AS prev_shipped
+    FROM daily_logs
+    WHERE date BETWEEN :prev_week_start AND :week_end
+)"""
+
+DASHBOARD_SQL = f"""
+WITH today AS (
+    SELECT mission, mission_status FROM daily_logs WHERE date = :today
+),{WEEKS_CTE},
+paralysis AS (
+    SELECT
+        COUNT(*) AS total_days,
+        SUM(CASE WHEN paralysis_signals THEN 1 ELSE 0 END) AS paralysis_days
+    FROM daily_logs
+    WHERE date >= :paralysis_cutoff
+),
+active_projects AS (
+    SELECT json_group_array(json_array(name, target_date)) AS active
+    FROM projects
+    WHERE status = 'active'
+)
+SELECT
+    (SELECT mission FROM today) AS mission,
+    (SELECT mission_status FROM today) AS mission_status,
+    weeks.week_total,
+    weeks.week_shipped,
+    weeks.prev_total,
+    weeks.prev_shipped,
+    paralysis.total_days,
+    paralysis.paralysis_days,
+    active_projects.active
+FROM weeks, paralysis, active_projects
+"""
+
+
+def dashboard_params(today: date, days: int = 30) -> Dict[str, str]:
+    """Bind parameters for DASHBOARD_SQL (ISO date strings, as stored)."""
+    week_start = get_week_start(today)
+
+    return {
+        "today": today.isoformat(),
+        "week_start": week_start.isoformat(),
+        "prev_week_start": (week_start - timedelta(weeks=1)).isoformat(),
+        "week_end": (week_start + timedelta(days=6)).isoformat(),
+        "paralysis_cutoff": (today - timedelta(days=days)).isoformat(),
+    }
+
+
+def build_dashboard_snapshot(row: Mapping, week_start: date) -> DashboardSnapshot:
+    """Turn a DASHBOARD_SQL result row (any name-indexable row) into a snapshot."""
+    total = row["week_total"] or 0
+    shipped = row["week_shipped"] or 0
+    prev_total = row["prev_total"] or 0
+    prev_shipped = row["prev_shipped"] or 0
+
+    completion_rate = (shipped / total * 100) if total > 0 else 0
+    prev_rate = (prev_shipped / prev_total * 100) if prev_total > 0 else 0
+
+    active_projects = [
+        (name, date.fromisoformat(target) if target else None)
+        for name, target in json.loads(row["active"])
+    ]
+
+    return DashboardSnapshot(
+        today_mission=row["mission"],
+        today_mission_status=row["mission_status"],
+        week={
+            "shipped": shipped,
+            "total": total,
+            "completion_rate": completion_rate,
+            "improving": completion_rate > prev_rate,
+            "week_start": week_start,
+        },
+        paralysis=paralysis_stats(row["paralysis_days"] or 0, row["total_days"]),
+        active_projects=active_projects,
+    )
+
+
+def get_hours_until_eod() -> int:
+    """Calculate hours until end of day (17:00)."""
+    # Simple: assume EOD is 17:00
+    # This is a simplification - in real implementation would check actual time
+    return 8  # Placeholder
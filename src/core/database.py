@@ -4,61 +4,149 @@ Database connection and session management.
 Simple SQLite with WAL mode for better concurrency.
 """
 
-import os
-from pathlib import Path
-from typing import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date
+from typing import Generator, Iterable, Iterator, Optional
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import (
+    String,
+    bindparam,
+    create_engine,
+    event,
+    func,
+    lambda_stmt,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
-from src.core.models import Base
+from src.core.models import Base, DailyLog, Decision, Project
+from src.core.paths import get_db_path
 
+# Built once per process - a CLI command may open several sessions
+_ENGINE: Optional[Engine] = None
+_SESSION_FACTORY: Optional[sessionmaker] = None
 
-def get_db_path() -> Path:
-    """Get database path from env or default to ~/.ceo-os/data.db."""
-    db_path_str = os.getenv("CEO_DB_PATH")
+# Session shared by everything running inside an open scoped_session()
+_CURRENT_SESSION: ContextVar[Optional[Session]] = ContextVar(
+    "current_session", default=None
+)
 
-    if db_path_str:
-        db_path = Path(db_path_str)
-    else:
-        db_path = Path.home() / ".ceo-os" / "data.db"
 
-    # Create parent directory if it doesn't exist
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    return db_path
-
-
-@event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
     """Enable WAL mode and other optimizations for SQLite."""
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped reads
+    cursor.execute("PRAGMA cache_size=-64000")  # ~64MB page cache
     cursor.close()
 
 
 def create_engine_instance() -> Engine:
-    """Create SQLAlchemy engine with proper configuration."""
-    db_path = get_db_path()
-
-    engine = create_engine(
-        f"sqlite:///{db_path}",
-        connect_args={"timeout": 30},
-        poolclass=NullPool,  # Simple connection management
-        echo=False,  # Set to True for SQL debugging
-    )
+    """Get the process-wide SQLAlchemy engine, creating it on first use."""
+    global _ENGINE
 
-    return engine
+    if _ENGINE is None:
+        db_path = get_db_path()
+
+        _ENGINE = create_engine(
+            f"sqlite:///{db_path}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+            # One connection per process: PRAGMAs run once, not per session
+            poolclass=StaticPool,
+            # Compiled SQL is reused across calls; sized for every metric query
+            query_cache_size=1200,
+            future=True,
+            echo=False,  # Set to True for SQL debugging
+        )
+        # Only the app database; other engines (e.g. tests) keep their own
+        event.listen(_ENGINE, "connect", set_sqlite_pragma)
+        # Installs upgraded from UUID log IDs can't insert until migrated;
+        # don't wait for them to re-run `ceo setup`
+        _migrate_integer_ids(_ENGINE)
+
+    return _ENGINE
+
+
+def reset_engine() -> None:
+    """Dispose the cached engine and forget the cached database path.
+
+    Needed when CEO_DB_PATH changes within a process (e.g. in tests).
+    """
+    global _ENGINE, _SESSION_FACTORY
+
+    if _ENGINE is not None:
+        _ENGINE.dispose()
+
+    _ENGINE = None
+    _SESSION_FACTORY = None
+    get_db_path.cache_clear()
 
 
 def init_database() -> None:
     """Initialize database tables if they don't exist."""
     engine = create_engine_instance()
     Base.metadata.create_all(engine)
+    _migrate_integer_ids(engine)
+
+    # create_all skips existing tables; add indexes introduced since
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def _migrate_integer_ids(engine: Engine) -> None:
+    """Rebuild daily_logs/decisions created with UUID string primary keys.
+
+    SQLite cannot change a column type in place, so the old table is
+    renamed, recreated from the model and copied over (new integer IDs).
+    Up-to-date databases only pay for the pragma_table_info probes.
+    """
+    with engine.connect() as conn:
+        legacy_tables = []
+        for table in (DailyLog.__table__, Decision.__table__):
+            id_type = conn.exec_driver_sql(
+                f"SELECT type FROM pragma_table_info('{table.name}') WHERE name = 'id'"
+            ).scalar()
+            if id_type is not None and id_type.upper() != "INTEGER":
+                legacy_tables.append(table)
+        if not legacy_tables:
+            return
+
+        # pysqlite autocommits DDL unless a transaction is opened explicitly
+        conn.exec_driver_sql("BEGIN")
+        for table in legacy_tables:
+            legacy = f"{table.name}_legacy"
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} RENAME TO {legacy}")
+            # Index names move with the renamed table; free them up
+            index_names = conn.exec_driver_sql(
+                f"SELECT name FROM pragma_index_list('{legacy}') WHERE origin = 'c'"
+            ).scalars().all()
+            for index_name in index_names:
+                conn.exec_driver_sql(f"DROP INDEX {index_name}")
+
+            table.create(conn)
+            legacy_columns = set(
+                conn.exec_driver_sql(
+                    f"SELECT name FROM pragma_table_info('{legacy}')"
+                ).scalars()
+            )
+            columns = ", ".join(
+                c.name for c in table.columns if c.name in legacy_columns - {"id"}
+            )
+            conn.exec_driver_sql(
+                f"INSERT INTO {table.name} ({columns}) "
+                f"SELECT {columns} FROM {legacy} ORDER BY created_at"
+            )
+            conn.exec_driver_sql(f"DROP TABLE {legacy}")
+        conn.commit()
 
 
 def get_session() -> Session:
@@ -75,9 +163,14 @@ def get_session() -> Session:
         finally:
             session.close()
     """
-    engine = create_engine_instance()
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
-    return SessionLocal()
+    global _SESSION_FACTORY
+
+    if _SESSION_FACTORY is None:
+        _SESSION_FACTORY = sessionmaker(
+            bind=create_engine_instance(), expire_on_commit=False
+        )
+
+    return _SESSION_FACTORY()
 
 
 def get_session_context() -> Generator[Session, None, None]:
@@ -97,3 +190,99 @@ def get_session_context() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+@contextmanager
+def scoped_session() -> Iterator[Session]:
+    """Get the ambient session, opening one if none is active.
+
+    The outermost block owns the session: it rolls back on error and
+    closes on exit. Nested blocks reuse it, so a whole CLI invocation
+    (status header + command + protocols) runs on a single session.
+
+    Usage:
+        with scoped_session() as session:
+            # ... do work ...
+            session.commit()
+    """
+    session = _CURRENT_SESSION.get()
+    if session is not None:
+        yield session
+        return
+
+    session = get_session()
+    token = _CURRENT_SESSION.set(session)
+    try:
+        yield session
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        _CURRENT_SESSION.reset(token)
+        session.close()
+
+
+def bulk_save(session: Session, objects: Iterable[Base]) -> None:
+    """Insert many new rows in one batched flush (e.g. bulk imports).
+
+    Skips per-object unit-of-work bookkeeping; caller still commits.
+    """
+    session.bulk_save_objects(list(objects))
+
+
+# Today's-log statements, built once at import. The date is bound as the
+# ISO string SQLite stores, which skips the Date type adapter, and the SQL
+# text never changes, so the sqlite3 statement cache on the (StaticPool)
+# connection keeps reusing the prepared statement.
+_LOG_DATE = bindparam("log_date", type_=String)
+
+DAILY_LOG_BY_DATE = select(DailyLog).where(DailyLog.date == _LOG_DATE)
+
+DAILY_LOG_SUMMARY = (
+    select(DailyLog.mission, DailyLog.mission_status)
+    .where(DailyLog.date == _LOG_DATE)
+    .limit(1)
+)
+
+# Writes nothing if the date already has a log
+INSERT_DAILY_LOG = sqlite_insert(DailyLog).on_conflict_do_nothing(
+    index_elements=[DailyLog.date]
+)
+
+# Only touches a log that has a mission; blocker_type is kept unless given
+COMPLETE_MISSION = (
+    update(DailyLog)
+    .where(DailyLog.date == _LOG_DATE, DailyLog.mission.isnot(None))
+    .values(
+        mission_status=bindparam("status"),
+        blocker_type=func.coalesce(bindparam("blocker"), DailyLog.blocker_type),
+    )
+    .returning(DailyLog.mission)
+    .execution_options(synchronize_session=False)
+)
+
+
+def get_daily_log_by_date(session: Session, log_date: date) -> Optional[DailyLog]:
+    """Get the daily log for a given date."""
+    return session.scalars(
+        DAILY_LOG_BY_DATE, {"log_date": log_date.isoformat()}
+    ).first()
+
+
+# Other hot lookups are built with lambda_stmt so the ORM -> SQL compilation
+# is cached on first use and only the bound parameters change between calls.
+
+
+def get_project_by_id_prefix(session: Session, project_id: str) -> Optional[Project]:
+    """Get a project by (a prefix of) its ID.
+
+    Uses a plain range on the primary key rather than LIKE, which SQLite
+    only serves from the index under specific collation/pragma settings.
+    """
+    upper = project_id + "\uffff"
+    stmt = lambda_stmt(
+        lambda: select(Project)
+        .where(Project.id >= project_id, Project.id < upper)
+        .limit(1)
+    )
+    return session.scalars(stmt).first()
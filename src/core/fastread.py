@@ -0,0 +1,53 @@
+"""
+Read-only fast path straight on the sqlite3 driver.
+
+Pure reads with a trivial shape (status header, dashboards) skip the
+ORM session, identity map and unit of work entirely - and never import
+SQLAlchemy. Anything that writes goes through src.core.database as usual.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
+from typing import Iterator, Optional
+
+from src.core.dashboard import (
+    DASHBOARD_SQL,
+    DashboardSnapshot,
+    build_dashboard_snapshot,
+    dashboard_params,
+    get_week_start,
+)
+from src.core.paths import get_db_path
+
+DAILY_LOG_SQL = """
+SELECT energy, paralysis_signals, mission, mission_done_definition,
+       mission_target_time, mission_status
+FROM daily_logs
+WHERE date = ?
+"""
+
+
+@contextmanager
+def connect() -> Iterator[sqlite3.Connection]:
+    """Open a plain sqlite3 connection (autocommit, rows indexable by name)."""
+    conn = sqlite3.connect(get_db_path(), isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def get_daily_log(conn: sqlite3.Connection, log_date: date) -> Optional[sqlite3.Row]:
+    """Get the displayed columns of a day's log."""
+    return conn.execute(DAILY_LOG_SQL, (log_date.isoformat(),)).fetchone()
+
+
+def get_dashboard_snapshot(
+    conn: sqlite3.Connection, days: int = 30, today: Optional[date] = None
+) -> DashboardSnapshot:
+    """Same as metrics.get_dashboard_snapshot, without the ORM."""
+    today = today or date.today()
+    row = conn.execute(DASHBOARD_SQL, dashboard_params(today, days)).fetchone()
+    return build_dashboard_snapshot(row, get_week_start(today))
@@ -6,121 +6,206 @@ Calculates weekly/monthly metrics on demand.
 """
 
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple
-
-from sqlalchemy import func
-from sqlalchemy.orm import Session
-
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from sqlalchemy import bindparam, case, func, select, text
+from sqlalchemy.orm import Session, load_only
+
+from src.core.dashboard import (
+    DASHBOARD_SQL,
+    WEEKS_CTE,
+    DashboardSnapshot,
+    build_dashboard_snapshot,
+    dashboard_params,
+    get_week_start,
+    paralysis_stats,
+)
 from src.core.models import DailyLog, Decision, Project
 
+# Hot metric statements are built once; only bound parameters vary per call
+_TODAY_STATUS_STMT = select(DailyLog).where(DailyLog.date == bindparam("d"))
 
-def get_week_start(target_date: Optional[date] = None) -> date:
-    """Get Monday of the current week."""
-    if target_date is None:
-        target_date = date.today()
 
-    # Get Monday (weekday 0)
-    days_since_monday = target_date.weekday()
-    week_start = target_date - timedelta(days=days_since_monday)
-    return week_start
+def get_today_status(
+    session: Session, today: Optional[date] = None
+) -> Optional[DailyLog]:
+    """Get today's check-in status."""
+    today = today or date.today()
+    return session.scalars(_TODAY_STATUS_STMT, {"d": today}).first()
 
 
-def get_today_status(session: Session) -> Optional[DailyLog]:
-    """Get today's check-in status."""
-    today = date.today()
-    return session.query(DailyLog).filter(DailyLog.date == today).first()
+# SQLite: next Sunday (or same day), back 6 days -> Monday
+_WEEK_START_EXPR = func.date(DailyLog.date, "weekday 0", "-6 days")
 
+_WEEK_COUNTS_STMT = (
+    select(
+        _WEEK_START_EXPR,
+        func.count(DailyLog.mission),
+        func.count(case((DailyLog.mission_status == "shipped", 1))),
+    )
+    .where(DailyLog.date.between(bindparam("earliest"), bindparam("week_end")))
+    .group_by(_WEEK_START_EXPR)
+)
 
-def get_week_stats(session: Session, weeks_ago: int = 0) -> Dict:
-    """Calculate weekly completion statistics.
 
-    Args:
-        session: Database session
-        weeks_ago: 0 for current week, 1 for last week, etc.
+def _get_weeks_stats_bulk(
+    session: Session, latest_week_start: date, n_weeks: int
+) -> Dict[date, Tuple[int, int]]:
+    """Count (total, shipped) missions for n_weeks weeks in one query.
 
-    Returns:
-        Dict with shipped, total, completion_rate, improving
+    Returns a dict keyed by week start (Monday); weeks without logs are
+    missing from it.
     """
-    # Get week boundaries
-    target_week_start = get_week_start() - timedelta(weeks=weeks_ago)
-    week_end = target_week_start + timedelta(days=6)
-
-    # Get logs for this week
-    logs = (
-        session.query(DailyLog)
-        .filter(DailyLog.date >= target_week_start, DailyLog.date <= week_end)
-        .all()
+    earliest = latest_week_start - timedelta(weeks=n_weeks - 1)
+    week_end = latest_week_start + timedelta(days=6)
+
+    rows = session.execute(
+        _WEEK_COUNTS_STMT, {"earliest": earliest, "week_end": week_end}
     )
+    return {date.fromisoformat(wk): (total, shipped) for wk, total, shipped in rows}
 
-    # Count statuses
-    total = len([log for log in logs if log.mission is not None])
-    shipped = len([log for log in logs if log.mission_status == "shipped"])
 
+def _week_stats(
+    counts: Mapping[date, Tuple[int, int]],
+    week_start: date,
+    prev_week_start: Optional[date],
+) -> Dict:
+    """Build the get_week_stats() dict from bulk week counts."""
+    total, shipped = counts.get(week_start, (0, 0))
     completion_rate = (shipped / total * 100) if total > 0 else 0
 
     # Compare to previous week
-    prev_week_stats = (
-        get_week_stats(session, weeks_ago + 1) if weeks_ago < 12 else None
-    )
-    improving = (
-        completion_rate > prev_week_stats["completion_rate"]
-        if prev_week_stats
-        else False
-    )
+    improving = False
+    if prev_week_start is not None:
+        prev_total, prev_shipped = counts.get(prev_week_start, (0, 0))
+        prev_rate = (prev_shipped / prev_total * 100) if prev_total > 0 else 0
+        improving = completion_rate > prev_rate
 
     return {
         "shipped": shipped,
         "total": total,
         "completion_rate": completion_rate,
         "improving": improving,
-        "week_start": target_week_start,
+        "week_start": week_start,
     }
 
 
-def get_paralysis_rate(session: Session, days: int = 30) -> Dict:
+def get_week_stats(
+    session: Session, weeks_ago: int = 0, today: Optional[date] = None
+) -> Dict:
+    """Calculate weekly completion statistics.
+
+    Args:
+        session: Database session
+        weeks_ago: 0 for current week, 1 for last week, etc.
+        today: Reference date (defaults to date.today())
+
+    Returns:
+        Dict with shipped, total, completion_rate, improving
+    """
+    # Get week boundaries
+    target_week_start = get_week_start(today) - timedelta(weeks=weeks_ago)
+
+    # Weeks up to 12 ago are compared with the week before
+    if weeks_ago < 12:
+        prev_week_start = target_week_start - timedelta(weeks=1)
+        counts = _get_weeks_stats_bulk(session, target_week_start, n_weeks=2)
+    else:
+        prev_week_start = None
+        counts = _get_weeks_stats_bulk(session, target_week_start, n_weeks=1)
+
+    return _week_stats(counts, target_week_start, prev_week_start)
+
+
+_PARALYSIS_STMT = select(
+    func.count(DailyLog.id),
+    func.coalesce(func.sum(case((DailyLog.paralysis_signals, 1), else_=0)), 0),
+).where(DailyLog.date >= bindparam("cutoff"))
+
+
+def get_paralysis_rate(
+    session: Session, days: int = 30, today: Optional[date] = None
+) -> Dict:
     """Calculate paralysis rate over last N days."""
-    cutoff = date.today() - timedelta(days=days)
+    cutoff = (today or date.today()) - timedelta(days=days)
 
-    logs = (
-        session.query(DailyLog)
-        .filter(DailyLog.date >= cutoff)
-        .order_by(DailyLog.date.desc())
-        .all()
-    )
+    total_days, paralysis_days = session.execute(
+        _PARALYSIS_STMT, {"cutoff": cutoff}
+    ).one()
 
-    total_days = len(logs)
-    paralysis_days = len([log for log in logs if log.paralysis_signals])
+    return paralysis_stats(paralysis_days, total_days)
 
-    rate = (paralysis_days / total_days * 100) if total_days > 0 else 0
 
-    return {
-        "paralysis_days": paralysis_days,
-        "total_days": total_days,
-        "paralysis_rate": rate,
-        "recent_episodes": paralysis_days,  # For circuit breaker
-    }
+def get_dashboard_snapshot(
+    session: Session, days: int = 30, today: Optional[date] = None
+) -> DashboardSnapshot:
+    """Read today's status, week stats, active projects and paralysis rate.
+
+    One round trip instead of the four separate metric queries.
+    """
+    today = today or date.today()
+    row = (
+        session.execute(text(DASHBOARD_SQL), dashboard_params(today, days))
+        .mappings()
+        .one()
+    )
+    return build_dashboard_snapshot(row, get_week_start(today))
+
+
+# Callers show names/deadlines; other columns load on first access
+_ACTIVE_PROJECTS_STMT = (
+    select(Project)
+    .options(load_only(Project.name, Project.status, Project.target_date))
+    .where(Project.status == "active")
+)
 
 
 def get_active_projects(session: Session) -> List[Project]:
     """Get all active projects."""
-    return session.query(Project).filter(Project.status == "active").all()
+    return session.scalars(_ACTIVE_PROJECTS_STMT).all()
+
+
+_ACTIVE_PROJECT_COUNT = (
+    select(func.count()).select_from(Project).where(Project.status == "active")
+)
+
+
+def count_active_projects(session: Session) -> int:
+    """Count active projects without loading them."""
+    return session.execute(_ACTIVE_PROJECT_COUNT).scalar()
+
+
+def get_project_slots(session: Session) -> Tuple[List[Project], bool]:
+    """Get active projects and whether another one fits under the cap."""
+    active = session.scalars(_ACTIVE_PROJECTS_STMT).all()
+    return active, len(active) < 3
 
 
 def can_add_project(session: Session) -> bool:
     """Check if can add new project (hard cap at 3)."""
-    active_count = session.query(Project).filter(Project.status == "active").count()
-    return active_count < 3
+    return count_active_projects(session) < 3
+
 
+_DECISION_STATS_STMT = select(
+    func.count(Decision.id),
+    func.count(Decision.time_to_decide),
+    func.avg(Decision.time_to_decide),
+    func.sum(case((Decision.time_to_decide <= 20, 1), else_=0)),
+    func.sum(case((Decision.made_under_paralysis, 1), else_=0)),
+).where(Decision.date >= bindparam("cutoff"))
 
-def get_decision_stats(session: Session, days: int = 30) -> Dict:
+
+def get_decision_stats(
+    session: Session, days: int = 30, today: Optional[date] = None
+) -> Dict:
     """Calculate decision timing statistics."""
-    cutoff = date.today() - timedelta(days=days)
+    cutoff = (today or date.today()) - timedelta(days=days)
 
-    decisions = (
-        session.query(Decision).filter(Decision.date >= cutoff).all()
-    )
+    total, timed, avg_time, under_20, paralysis = session.execute(
+        _DECISION_STATS_STMT, {"cutoff": cutoff}
+    ).one()
 
-    if not decisions:
+    if not total:
         return {
             "total_decisions": 0,
             "avg_time": 0,
@@ -128,25 +213,73 @@ def get_decision_stats(session: Session, days: int = 30) -> Dict:
             "paralysis_decisions": 0,
         }
 
-    # Filter decisions with time data
-    timed = [d for d in decisions if d.time_to_decide is not None]
-    under_20 = [d for d in timed if d.under_20_minutes]
-    paralysis = [d for d in decisions if d.made_under_paralysis]
-
-    avg_time = (
-        sum(d.time_to_decide for d in timed) / len(timed) if timed else 0
-    )
-    under_20_rate = (len(under_20) / len(timed) * 100) if timed else 0
+    under_20_rate = (under_20 / timed * 100) if timed else 0
 
     return {
-        "total_decisions": len(decisions),
-        "avg_time": avg_time,
+        "total_decisions": total,
+        "avg_time": avg_time or 0,
         "under_20min_rate": under_20_rate,
-        "paralysis_decisions": len(paralysis),
+        "paralysis_decisions": paralysis,
     }
 
 
-def check_circuit_breaker_conditions(session: Session) -> Tuple[bool, List[str]]:
+class CircuitBreakerAggregate(NamedTuple):
+    """Circuit breaker trip flags, plus the numbers quoted in the reasons."""
+
+    paralysis_trip: bool
+    completion_trip: bool
+    stalled_trip: bool
+    paralysis_days: int
+    this_rate: float
+    last_rate: float
+
+
+CIRCUIT_BREAKER_SQL = f"""
+WITH paralysis_30d AS (
+    SELECT COUNT(*) AS paralysis_days
+    FROM daily_logs
+    WHERE date >= :paralysis_cutoff AND paralysis_signals
+),{WEEKS_CTE},
+weeks_completion AS (
+    SELECT
+        COALESCE(week_shipped * 100.0 / NULLIF(week_total, 0), 0) AS this_rate,
+        COALESCE(prev_shipped * 100.0 / NULLIF(prev_total, 0), 0) AS last_rate
+    FROM weeks
+),
+projects_today AS (
+    -- A third active project exists (stops at the third index hit) and
+    -- today's mission is blocked
+    SELECT
+        EXISTS (SELECT 1 FROM projects WHERE status = 'active' LIMIT 1 OFFSET 2)
+        AND COALESCE(
+            (SELECT mission_status FROM daily_logs WHERE date = :today) = 'blocked',
+            0
+        ) AS stalled
+)
+SELECT
+    paralysis_30d.paralysis_days >= 5,
+    weeks_completion.this_rate < 60 AND weeks_completion.last_rate < 60,
+    projects_today.stalled,
+    paralysis_30d.paralysis_days,
+    weeks_completion.this_rate,
+    weeks_completion.last_rate
+FROM paralysis_30d, weeks_completion, projects_today
+"""
+
+
+def _circuit_breaker_aggregate(
+    session: Session, today: date
+) -> CircuitBreakerAggregate:
+    """Evaluate every circuit breaker condition in one round trip."""
+    row = session.execute(
+        text(CIRCUIT_BREAKER_SQL), dashboard_params(today, days=30)
+    ).one()
+    return CircuitBreakerAggregate(*row)
+
+
+def check_circuit_breaker_conditions(
+    session: Session, today: Optional[date] = None
+) -> Tuple[bool, List[str]]:
     """Check if circuit breaker should trigger.
 
     Conditions:
@@ -158,37 +291,19 @@ def check_circuit_breaker_conditions(session: Session) -> Tuple[bool, List[str]]
         (should_trigger, reasons)
     """
     reasons = []
+    result = _circuit_breaker_aggregate(session, today or date.today())
 
-    # Check paralysis rate
-    paralysis_stats = get_paralysis_rate(session, days=30)
-    if paralysis_stats["recent_episodes"] >= 5:
-        reasons.append(f"5+ paralysis episodes ({paralysis_stats['recent_episodes']})")
+    if result.paralysis_trip:
+        reasons.append(f"5+ paralysis episodes ({result.paralysis_days})")
 
-    # Check completion rate for last 2 weeks
-    this_week = get_week_stats(session, weeks_ago=0)
-    last_week = get_week_stats(session, weeks_ago=1)
-
-    if this_week["completion_rate"] < 60 and last_week["completion_rate"] < 60:
+    if result.completion_trip:
         reasons.append(
             f"Completion <60% for 2 weeks "
-            f"({this_week['completion_rate']:.0f}%, {last_week['completion_rate']:.0f}%)"
+            f"({result.this_rate:.0f}%, {result.last_rate:.0f}%)"
         )
 
-    # Check if all projects blocked
-    active_projects = get_active_projects(session)
-    if len(active_projects) >= 3:
-        # Check if today's mission is blocked
-        today = get_today_status(session)
-        if today and today.mission_status == "blocked":
-            reasons.append("All projects stalled (mission blocked)")
+    if result.stalled_trip:
+        reasons.append("All projects stalled (mission blocked)")
 
     should_trigger = len(reasons) > 0
     return should_trigger, reasons
-
-
-def get_hours_until_eod() -> int:
-    """Calculate hours until end of day (17:00)."""
-    now = date.today()
-    # Simple: assume EOD is 17:00
-    # This is a simplification - in real implementation would check actual time
-    return 8  # Placeholder
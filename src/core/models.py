@@ -11,9 +11,22 @@ from datetime import date, datetime
 from typing import Optional
 import uuid
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Integer, String, Text, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.ext.declarative import declarative_base
 
+from src.core.dashboard import days_until
+
 Base = declarative_base()
 
 
@@ -30,13 +43,24 @@ class DailyLog(Base):
     """
 
     __tablename__ = "daily_logs"
-
-    id = Column(String, primary_key=True, default=generate_uuid)
+    __table_args__ = (
+        # Covers the date-range aggregates (weeks, paralysis, dashboard)
+        Index(
+            "ix_daily_log_date_mission_status",
+            "date",
+            "mission",
+            "mission_status",
+            "paralysis_signals",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
     date = Column(Date, unique=True, nullable=False, index=True)
 
     # Morning check-in (60 seconds)
     energy = Column(String(10))  # high/medium/low
-    paralysis_signals = Column(Boolean, default=False)  # ANY tension/circular thinking
+    # ANY tension/circular thinking; filled in by SQLite when not given
+    paralysis_signals = Column(Boolean, nullable=False, server_default=text("0"))
     mission = Column(Text)  # Today's ONE thing
     mission_done_definition = Column(Text)  # What does DONE look like?
     mission_target_time = Column(String(5))  # HH:MM when it should be done
@@ -69,6 +93,7 @@ class Project(Base):
 
     __tablename__ = "projects"
 
+    # UUID kept: users address projects by ID prefix
     id = Column(String, primary_key=True, default=generate_uuid)
     name = Column(String(255), nullable=False)
     target_date = Column(Date)  # When you want to ship
@@ -89,10 +114,11 @@ class Project(Base):
     @property
     def days_remaining(self) -> Optional[int]:
         """Days until target date."""
-        if not self.target_date:
-            return None
-        delta = self.target_date - date.today()
-        return delta.days
+        return days_until(self.target_date, date.today())
+
+
+# Decision outcomes that call for a follow-up
+_FOLLOWUP_OUTCOMES = frozenset({"blocked", "revisited"})
 
 
 class Decision(Base):
@@ -102,8 +128,14 @@ class Decision(Base):
     """
 
     __tablename__ = "decisions"
-
-    id = Column(String, primary_key=True, default=generate_uuid)
+    __table_args__ = (
+        # Covers get_decision_stats
+        Index(
+            "ix_decisions_date_time", "date", "time_to_decide", "made_under_paralysis"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
     date = Column(Date, nullable=False, index=True)
     decision = Column(Text, nullable=False)
 
@@ -126,4 +158,4 @@ class Decision(Base):
     @property
     def needs_followup(self) -> bool:
         """Check if decision needs follow-up."""
-        return self.outcome in ["blocked", "revisited"]
+        return self.outcome in _FOLLOWUP_OUTCOMES
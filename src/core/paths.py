@@ -0,0 +1,25 @@
+"""
+Location of the SQLite database file.
+
+Kept free of SQLAlchemy so the raw sqlite3 read path can import it.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def get_db_path() -> Path:
+    """Get database path from env or default to ~/.ceo-os/data.db."""
+    db_path_str = os.getenv("CEO_DB_PATH")
+
+    if db_path_str:
+        db_path = Path(db_path_str)
+    else:
+        db_path = Path.home() / ".ceo-os" / "data.db"
+
+    # Create parent directory if it doesn't exist
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    return db_path
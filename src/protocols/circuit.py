@@ -6,14 +6,15 @@ Disables normal operations, forces simplification to ONE project.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
-from src.core.database import get_session
+from src.core.database import scoped_session
 from src.core.metrics import (
     check_circuit_breaker_conditions,
     get_active_projects,
@@ -24,9 +25,41 @@ console = Console()
 CIRCUIT_BREAKER_FLAG = Path.home() / ".ceo-os" / ".circuit_breaker_active"
 
 
+def _flag_signature() -> Optional[Tuple[int, int, int]]:
+    """(mtime, size, inode) of the flag file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(CIRCUIT_BREAKER_FLAG)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+@lru_cache(maxsize=1)
+def _read_flag(signature: Tuple[int, int, int]) -> str:
+    """Flag file contents, re-read only when the file changes.
+
+    mtime alone misses rewrites within one timestamp tick and files
+    restored with their old mtime; size and inode catch those.
+    """
+    return CIRCUIT_BREAKER_FLAG.read_text()
+
+
 def is_circuit_breaker_active() -> bool:
     """Check if circuit breaker is currently active."""
-    return CIRCUIT_BREAKER_FLAG.exists()
+    return _flag_signature() is not None
+
+
+def read_circuit_breaker_config() -> Optional[str]:
+    """Get the simplified-mode config, or None if the breaker is inactive."""
+    signature = _flag_signature()
+    if signature is None:
+        return None
+
+    try:
+        return _read_flag(signature)
+    except FileNotFoundError:
+        # Deactivated between the stat and the read
+        return None
 
 
 def activate_circuit_breaker(reasons: List[str]):
@@ -49,9 +82,7 @@ def activate_circuit_breaker(reasons: List[str]):
         )
     )
 
-    session = get_session()
-
-    try:
+    with scoped_session() as session:
         # Force selection of ONE project
         console.print("\n[yellow bold]STEP 1: Pick ONE Project[/yellow bold]\n")
         console.print("Everything else gets deferred or delegated.\n")
@@ -138,9 +169,6 @@ def activate_circuit_breaker(reasons: List[str]):
             )
         )
 
-    finally:
-        session.close()
-
 
 def deactivate_circuit_breaker():
     """Exit simplified mode (with validation)."""
@@ -187,9 +215,7 @@ def deactivate_circuit_breaker():
 
 def check_and_warn():
     """Check if should trigger circuit breaker and warn user."""
-    session = get_session()
-
-    try:
+    with scoped_session() as session:
         should_trigger, reasons = check_circuit_breaker_conditions(session)
 
         if should_trigger:
@@ -210,6 +236,3 @@ def check_and_warn():
             return True
 
         return False
-
-    finally:
-        session.close()
@@ -12,7 +12,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, IntPrompt, Prompt
 
-from src.core.database import get_session
+from src.core.database import scoped_session
 from src.core.models import Decision
 
 console = Console()
@@ -27,120 +27,118 @@ def run_decision_protocol():
     3. Simplify (5 min) - Binary choice
     4. Commit (10 min) - Decide, document, communicate
     """
-    session = get_session()
+    with scoped_session() as session:
+        try:
+            console.print("\n[bold]STEP 1: EXTERNALIZE (2 minutes)[/bold]\n")
 
-    try:
-        console.print("\n[bold]STEP 1: EXTERNALIZE (2 minutes)[/bold]\n")
+            decision_text = Prompt.ask("What decision are you avoiding?")
+            fear = Prompt.ask("What's the fear behind the delay?")
 
-        decision_text = Prompt.ask("What decision are you avoiding?")
-        fear = Prompt.ask("What's the fear behind the delay?")
+            console.print(f"\n[dim]Decision: {decision_text}[/dim]")
+            console.print(f"[dim]Fear: {fear}[/dim]\n")
 
-        console.print(f"\n[dim]Decision: {decision_text}[/dim]")
-        console.print(f"[dim]Fear: {fear}[/dim]\n")
+            # Step 2: Set constraint
+            console.print("[bold]STEP 2: CONSTRAINT[/bold]\n")
+            console.print("[yellow]⏱ You have 20 minutes to decide.[/yellow]")
+            console.print("[dim]Timer starts... now![/dim]\n")
 
-        # Step 2: Set constraint
-        console.print("[bold]STEP 2: CONSTRAINT[/bold]\n")
-        console.print("[yellow]⏱ You have 20 minutes to decide.[/yellow]")
-        console.print("[dim]Timer starts... now![/dim]\n")
+            start_time = time.monotonic()
 
-        start_time = time.time()
+            # Step 3: Simplify
+            console.print("[bold]STEP 3: SIMPLIFY (Binary Choice)[/bold]\n")
 
-        # Step 3: Simplify
-        console.print("[bold]STEP 3: SIMPLIFY (Binary Choice)[/bold]\n")
+            option_a = Prompt.ask("Option A (simplest forward path)")
+            option_b = Prompt.ask("Option B (alternative)")
 
-        option_a = Prompt.ask("Option A (simplest forward path)")
-        option_b = Prompt.ask("Option B (alternative)")
+            console.print(f"\n  A: {option_a}")
+            console.print(f"  B: {option_b}\n")
 
-        console.print(f"\n  A: {option_a}")
-        console.print(f"  B: {option_b}\n")
+            # Step 4: Force decision
+            console.print("[bold]STEP 4: COMMIT - Make the call NOW[/bold]\n")
 
-        # Step 4: Force decision
-        console.print("[bold]STEP 4: COMMIT - Make the call NOW[/bold]\n")
-
-        choice = Prompt.ask(
-            "Which do you choose?",
-            choices=["A", "B", "flip"],
-            default="A",
-        )
-
-        if choice.lower() == "flip":
-            import random
-
-            choice = random.choice(["A", "B"])
-            console.print(f"\n🪙 [yellow]Coin flip: {choice}[/yellow]\n")
+            choice = Prompt.ask(
+                "Which do you choose?",
+                choices=["A", "B", "flip"],
+                default="A",
+            )
 
-        final_decision = option_a if choice.upper() == "A" else option_b
+            if choice.lower() == "flip":
+                import random
 
-        # Document rationale
-        rationale = Prompt.ask(
-            "\nWhy this choice? (prevents revisiting)",
-            default="Moving forward with action > perfection",
-        )
+                choice = random.choice(["A", "B"])
+                console.print(f"\n🪙 [yellow]Coin flip: {choice}[/yellow]\n")
 
-        # Calculate time taken
-        elapsed = int((time.time() - start_time) / 60)
+            final_decision = option_a if choice.upper() == "A" else option_b
 
-        # Force communication
-        console.print("\n[bold]Communicate to lock it in:[/bold]")
-        who = Prompt.ask("Who will you tell? (1 person minimum)", default="team")
+            # Document rationale
+            rationale = Prompt.ask(
+                "\nWhy this choice? (prevents revisiting)",
+                default="Moving forward with action > perfection",
+            )
 
-        confirmed = Confirm.ask(f"Will you tell {who} in the next 5 minutes?", default=True)
+            # Calculate time taken
+            elapsed = int((time.monotonic() - start_time) / 60)
 
-        if not confirmed:
-            console.print("[red]Communication = commitment. Try again.[/red]")
-            return
+            # Force communication
+            console.print("\n[bold]Communicate to lock it in:[/bold]")
+            who = Prompt.ask("Who will you tell? (1 person minimum)", default="team")
 
-        # Log decision
-        decision_record = Decision(
-            date=date.today(),
-            decision=f"{decision_text} → {final_decision}",
-            time_to_decide=elapsed,
-            made_under_paralysis=True,
-            outcome="proceeded",
-            notes=f"Rationale: {rationale}\nCommunicated to: {who}",
-        )
+            confirmed = Confirm.ask(f"Will you tell {who} in the next 5 minutes?", default=True)
 
-        session.add(decision_record)
-        session.commit()
+            if not confirmed:
+                console.print("[red]Communication = commitment. Try again.[/red]")
+                return
 
-        # Confirmation
-        console.print(
-            Panel(
-                f"[green bold]✓ DECISION MADE[/green bold]\n\n"
-                f"Decision: {final_decision}\n"
-                f"Time: {elapsed} minutes\n"
-                f"Communicated to: {who}\n\n"
-                f"[yellow]NOW: Take the FIRST ACTION immediately[/yellow]\n"
-                f"What's the smallest next step?",
-                title="Decision Logged",
-                border_style="green",
+            # Log decision
+            decision_record = Decision(
+                date=date.today(),
+                decision=f"{decision_text} → {final_decision}",
+                time_to_decide=elapsed,
+                made_under_paralysis=True,
+                outcome="proceeded",
+                notes=f"Rationale: {rationale}\nCommunicated to: {who}",
             )
-        )
 
-        first_action = Prompt.ask("\nFirst action (right now)")
-        console.print(f"\n[green]→ DO: {first_action}[/green]\n")
+            session.add(decision_record)
+            # Single commit, before the panel says it is logged
+            session.commit()
 
-        # Check time
-        if elapsed <= 20:
-            console.print(
-                f"[green]✓ Decision made in {elapsed} minutes (target: <20)[/green]\n"
-            )
-        else:
+            # Confirmation
             console.print(
-                f"[yellow]⚠ Took {elapsed} minutes (target: <20)[/yellow]\n"
-                f"[dim]Aim for faster decisions next time[/dim]\n"
+                Panel(
+                    f"[green bold]✓ DECISION MADE[/green bold]\n\n"
+                    f"Decision: {final_decision}\n"
+                    f"Time: {elapsed} minutes\n"
+                    f"Communicated to: {who}\n\n"
+                    f"[yellow]NOW: Take the FIRST ACTION immediately[/yellow]\n"
+                    f"What's the smallest next step?",
+                    title="Decision Logged",
+                    border_style="green",
+                )
             )
 
-    except KeyboardInterrupt:
-        console.print("\n[red]Cannot escape without deciding![/red]")
-        console.print("[yellow]Paralysis = circular thinking. Break the loop.[/yellow]\n")
-        session.rollback()
-    except Exception as e:
-        console.print(f"\n[red]Error: {e}[/red]")
-        session.rollback()
-        raise
-    finally:
-        session.close()
+            first_action = Prompt.ask("\nFirst action (right now)")
+            console.print(f"\n[green]→ DO: {first_action}[/green]\n")
+
+            # Check time
+            if elapsed <= 20:
+                console.print(
+                    f"[green]✓ Decision made in {elapsed} minutes (target: <20)[/green]\n"
+                )
+            else:
+                console.print(
+                    f"[yellow]⚠ Took {elapsed} minutes (target: <20)[/yellow]\n"
+                    f"[dim]Aim for faster decisions next time[/dim]\n"
+                )
+
+        except KeyboardInterrupt:
+            console.print("\n[red]Cannot escape without deciding![/red]")
+            console.print("[yellow]Paralysis = circular thinking. Break the loop.[/yellow]\n")
+            session.rollback()
+        except Exception as e:
+            console.print(f"\n[red]Error: {e}[/red]")
+            session.rollback()
+            raise
 
 
 def quick_decision_prompt(decision: str) -> str:
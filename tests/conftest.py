@@ -2,34 +2,242 @@
 Pytest configuration and fixtures.
 """
 
+import ast
+import hashlib
+import inspect
 import os
+import sqlite3
+import textwrap
+from contextlib import closing
+from datetime import date
 from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, configure_mappers, sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from src.core.models import Base
+from src.core import models
+from src.core.database import reset_engine
+from src.core.models import Base, DailyLog, Decision, Project
 
 
-@pytest.fixture(scope="function")
-def test_db_session() -> Session:
-    """Create an in-memory test database session."""
+def schema_template(cache_dir: Path) -> Path:
+    """Get a SQLite file holding the current schema, building it if needed.
+
+    Named after a hash of the models module, so a schema change simply
+    builds a new template. Written under a temp name and renamed, so
+    parallel workers never see a half-built file.
+    """
+    digest = hashlib.sha1(Path(models.__file__).read_bytes()).hexdigest()[:12]
+    template = cache_dir / f"schema-{digest}.sqlite"
+
+    if not template.exists():
+        building = template.with_suffix(f".{os.getpid()}.tmp")
+        engine = create_engine(f"sqlite:///{building}")
+        Base.metadata.create_all(engine)
+        engine.dispose()
+        os.replace(building, template)
+
+    return template
+
+
+def make_test_engine(template: Path) -> Engine:
+    """Create an in-memory test database with the schema in place.
+
+    The schema is copied page by page from the template (SQLite backup
+    API) instead of re-running the CREATE statements.
+    """
+
+    def connect() -> sqlite3.Connection:
+        # One shared in-memory connection, usable from any thread
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        with closing(sqlite3.connect(template)) as source:
+            source.backup(conn)
+        return conn
+
     # Use in-memory SQLite for tests
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    engine = create_engine(
+        "sqlite://",
+        creator=connect,
+        echo=False,
+        future=True,
+        # Per-test sessions share this engine's compiled-statement cache
+        query_cache_size=1200,
+        poolclass=StaticPool,
+    )
+
+    # Let SQLAlchemy own BEGIN so tests can run inside an outer transaction
+    # (pysqlite otherwise issues its own, breaking SAVEPOINT/ROLLBACK)
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+        # Throwaway data: no journal file, no syncing
+        dbapi_conn.execute("PRAGMA journal_mode=MEMORY")
+        dbapi_conn.execute("PRAGMA synchronous=OFF")
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def _uses_name(function, name: str) -> bool:
+    """Check whether a test function's body refers to ``name``."""
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+    except (OSError, TypeError, SyntaxError):
+        return True
+    body = tree.body[0].body if tree.body else []
+    return any(
+        isinstance(node, ast.Name) and node.id == name
+        for stmt in body
+        for node in ast.walk(stmt)
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """Warn about tests that request a database session they never use.
+
+    Pure-Python tests (model properties and the like) should not pay for
+    a connection and an outer transaction just to ignore them.
+    """
+    for item in items:
+        function = getattr(item, "function", None)
+        if (
+            function is not None
+            and "test_db_session" in getattr(item, "fixturenames", ())
+            and "test_db_session" in inspect.signature(function).parameters
+            and not _uses_name(function, "test_db_session")
+        ):
+            item.warn(
+                pytest.PytestWarning(
+                    f"{item.name} requests test_db_session but never uses it"
+                )
+            )
+
+
+@pytest.fixture(scope="session")
+def schema_file(pytestconfig, tmp_path_factory) -> Path:
+    """Schema template file, kept in the pytest cache across runs."""
+    cache = getattr(pytestconfig, "cache", None)  # None with -p no:cacheprovider
+    if cache is None:
+        return schema_template(tmp_path_factory.mktemp("schema"))
+    return schema_template(cache.mkdir("schema"))
+
 
-    # Create all tables
-    Base.metadata.create_all(engine)
+@pytest.fixture(scope="session")
+def engine(schema_file):
+    """Create the in-memory test database and its schema once per run.
 
-    # Create session
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    Session scope is per process, so under pytest-xdist (`pytest -n auto`)
+    every worker gets a private in-memory database.
+    """
+    engine = make_test_engine(schema_file)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(engine):
+    """Pay mapper configuration and first-statement compilation up front.
+
+    Keeps those one-off costs out of whichever test happens to run first.
+    Compiling alone fills no cache, so one flush (mapper INSERT cache) and
+    one SELECT per model (engine cache) really run, then roll back.
+    """
+    configure_mappers()
+    with engine.connect() as connection, connection.begin() as transaction:
+        with Session(bind=connection) as session:
+            session.add_all(
+                [
+                    DailyLog(date=date.today(), mission="Warm-up"),
+                    Project(name="Warm-up"),
+                    Decision(date=date.today(), decision="Warm-up"),
+                ]
+            )
+            session.flush()
+            for model in (DailyLog, Project, Decision):
+                session.scalars(select(model)).all()
+        transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+def sample_rows(schema_file):
+    """Persist one row per model once per run, for read-only tests.
+
+    Lives on its own engine so the committed rows never show up in
+    test_db_session.
+    """
+    engine = make_test_engine(schema_file)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+
+    # Plain INSERTs (no unit of work), then load the instances once
+    session.execute(
+        insert(DailyLog),
+        [
+            {
+                "date": date.today(),
+                "energy": "high",
+                "mission": "Ship feature X",
+                "mission_status": "shipped",
+            }
+        ],
+    )
+    session.execute(
+        insert(Project),
+        [{"name": "Launch MVP", "target_date": date(2024, 12, 31), "status": "active"}],
+    )
+    session.execute(
+        insert(Decision),
+        [
+            {
+                "date": date.today(),
+                "decision": "Hire candidate A",
+                "time_to_decide": 15,
+                "made_under_paralysis": True,
+                "outcome": "proceeded",
+            }
+        ],
+    )
+    session.commit()
+
+    rows = {
+        "daily_log": session.scalars(select(DailyLog)).one(),
+        "project": session.scalars(select(Project)).one(),
+        "decision": session.scalars(select(Decision)).one(),
+    }
+
+    yield {"session": session, **rows}
+
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db_session(engine) -> Session:
+    """Create a test session whose changes are rolled back afterwards."""
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    # Session commit/rollback work on SAVEPOINTs inside the outer transaction
+    SessionLocal = sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
     session = SessionLocal()
 
     yield session
 
     # Cleanup
     session.close()
-    Base.metadata.drop_all(engine)
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -38,8 +246,11 @@ def mock_env(tmp_path: Path, monkeypatch):
     # Use temp directory for database
     db_path = tmp_path / "test.db"
     monkeypatch.setenv("CEO_DB_PATH", str(db_path))
+    reset_engine()
 
     yield {
         "db_path": db_path,
         "tmp_path": tmp_path,
     }
+
+    reset_engine()
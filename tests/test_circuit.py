@@ -0,0 +1,59 @@
+"""
+Tests for the circuit breaker flag file.
+"""
+
+import os
+
+import pytest
+
+from src.protocols import circuit
+
+
+@pytest.fixture
+def flag_file(tmp_path, monkeypatch):
+    """Point the circuit breaker flag at a temp file."""
+    flag = tmp_path / ".circuit_breaker_active"
+    monkeypatch.setattr(circuit, "CIRCUIT_BREAKER_FLAG", flag)
+    circuit._read_flag.cache_clear()
+    yield flag
+    circuit._read_flag.cache_clear()
+
+
+def test_inactive_without_flag(flag_file):
+    """Test breaker is inactive when no flag file exists."""
+    assert circuit.is_circuit_breaker_active() is False
+    assert circuit.read_circuit_breaker_config() is None
+
+
+def test_config_reread_after_change(flag_file):
+    """Test cached config is refreshed when the flag file changes."""
+    flag_file.write_text("primary_project=A\n")
+    assert circuit.is_circuit_breaker_active() is True
+    assert circuit.read_circuit_breaker_config() == "primary_project=A\n"
+
+    flag_file.write_text("primary_project=B\n")
+    stat = flag_file.stat()
+    os.utime(flag_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert circuit.read_circuit_breaker_config() == "primary_project=B\n"
+
+    flag_file.unlink()
+    assert circuit.read_circuit_breaker_config() is None
+
+
+def test_config_reread_with_same_mtime(flag_file):
+    """Test a rewrite or restore that keeps the old mtime is still seen."""
+    flag_file.write_text("primary_project=A\n")
+    mtime = flag_file.stat().st_mtime_ns
+    assert circuit.read_circuit_breaker_config() == "primary_project=A\n"
+
+    # Same mtime, different size
+    flag_file.write_text("primary_project=Longer\n")
+    os.utime(flag_file, ns=(mtime, mtime))
+    assert circuit.read_circuit_breaker_config() == "primary_project=Longer\n"
+
+    # Same mtime and size, new file (inode) swapped in
+    restored = flag_file.with_name("restored")
+    restored.write_text("primary_project=Lonely\n")
+    os.utime(restored, ns=(mtime, mtime))
+    os.replace(restored, flag_file)
+    assert circuit.read_circuit_breaker_config() == "primary_project=Lonely\n"
@@ -0,0 +1,181 @@
+"""
+Tests for database connection management.
+"""
+
+import sqlite3
+from datetime import date, timedelta
+
+from sqlalchemy import func, select
+
+from src.core.database import (
+    COMPLETE_MISSION,
+    bulk_save,
+    create_engine_instance,
+    get_daily_log_by_date,
+    get_db_path,
+    get_project_by_id_prefix,
+    get_session,
+    init_database,
+    scoped_session,
+)
+from src.core.models import DailyLog, Decision, Project
+
+
+def test_db_path_from_env(mock_env):
+    """Test database path honours CEO_DB_PATH."""
+    assert get_db_path() == mock_env["db_path"]
+
+
+def test_engine_is_cached(mock_env):
+    """Test the engine is built once and reused."""
+    assert create_engine_instance() is create_engine_instance()
+
+
+def test_sessions_share_engine(mock_env):
+    """Test every session is bound to the cached engine."""
+    first = get_session()
+    second = get_session()
+
+    try:
+        assert first is not second
+        assert first.get_bind() is second.get_bind() is create_engine_instance()
+    finally:
+        first.close()
+        second.close()
+
+
+def test_sessions_reuse_connection(mock_env):
+    """Test sessions share one pooled SQLite connection."""
+    first = get_session()
+    second = get_session()
+
+    try:
+        first_conn = first.connection().connection.dbapi_connection
+        first.close()
+        second_conn = second.connection().connection.dbapi_connection
+        assert first_conn is second_conn
+    finally:
+        second.close()
+
+
+def test_scoped_session_is_shared_when_nested(mock_env):
+    """Test nested scoped_session blocks reuse the outer session."""
+    with scoped_session() as outer:
+        with scoped_session() as inner:
+            assert inner is outer
+
+    with scoped_session() as later:
+        assert later is not outer
+
+
+def test_get_daily_log_by_date(test_db_session):
+    """Test daily log lookup binds a fresh date on every call."""
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    test_db_session.add_all(
+        [
+            DailyLog(date=today, mission="Today"),
+            DailyLog(date=yesterday, mission="Yesterday"),
+        ]
+    )
+    test_db_session.commit()
+
+    assert get_daily_log_by_date(test_db_session, today).mission == "Today"
+    assert get_daily_log_by_date(test_db_session, yesterday).mission == "Yesterday"
+    assert get_daily_log_by_date(test_db_session, today + timedelta(days=1)) is None
+
+
+def test_get_project_by_id_prefix(test_db_session):
+    """Test project lookup by ID prefix."""
+    project = Project(name="Launch MVP", status="active")
+    test_db_session.add(project)
+    test_db_session.commit()
+
+    assert get_project_by_id_prefix(test_db_session, project.id[:8]) is project
+    assert get_project_by_id_prefix(test_db_session, project.id) is project
+    assert get_project_by_id_prefix(test_db_session, "zzzzzzzz") is None
+
+
+def test_bulk_save(test_db_session):
+    """Test bulk_save inserts every object."""
+    today = date.today()
+    bulk_save(
+        test_db_session,
+        (DailyLog(date=today - timedelta(days=i)) for i in range(5)),
+    )
+    test_db_session.commit()
+
+    count = select(func.count()).select_from(DailyLog)
+    assert test_db_session.execute(count).scalar_one() == 5
+
+
+def test_complete_mission(test_db_session):
+    """Test the mission update skips logs without a mission."""
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    test_db_session.add_all(
+        [DailyLog(date=today, mission="Ship it"), DailyLog(date=yesterday)]
+    )
+    test_db_session.commit()
+
+    def complete(log_date, status, blocker=None):
+        return test_db_session.execute(
+            COMPLETE_MISSION,
+            {"log_date": log_date.isoformat(), "status": status, "blocker": blocker},
+        ).scalar()
+
+    assert complete(today, "blocked", "external") == "Ship it"
+    assert complete(yesterday, "shipped") is None
+    test_db_session.commit()
+
+    log = get_daily_log_by_date(test_db_session, today)
+    test_db_session.refresh(log)
+    assert (log.mission_status, log.blocker_type) == ("blocked", "external")
+
+
+def _create_uuid_tables(db_path):
+    """Create daily_logs/decisions the way installs before integer IDs did."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE daily_logs "
+        "(id VARCHAR NOT NULL PRIMARY KEY, date DATE NOT NULL UNIQUE, "
+        "mission TEXT, created_at DATETIME)"
+    )
+    conn.execute("CREATE UNIQUE INDEX ix_daily_logs_date ON daily_logs (date)")
+    conn.execute(
+        "INSERT INTO daily_logs (id, date, mission) "
+        "VALUES ('0b6c8f5e-uuid', '2025-01-06', 'Old mission')"
+    )
+    conn.execute(
+        "CREATE TABLE decisions "
+        "(id VARCHAR NOT NULL PRIMARY KEY, date DATE NOT NULL, "
+        "decision TEXT NOT NULL, created_at DATETIME)"
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_init_database_migrates_uuid_ids(mock_env):
+    """Test logs stored with UUID string IDs move to integer IDs."""
+    _create_uuid_tables(mock_env["db_path"])
+
+    init_database()
+
+    with scoped_session() as session:
+        log = get_daily_log_by_date(session, date(2025, 1, 6))
+        assert log.id == 1
+        assert log.mission == "Old mission"
+
+
+def test_orm_inserts_into_unmigrated_database(mock_env):
+    """Test an upgraded install can write without re-running setup."""
+    _create_uuid_tables(mock_env["db_path"])
+
+    with scoped_session() as session:
+        log = DailyLog(date=date(2025, 1, 7), mission="New mission")
+        decision = Decision(date=date(2025, 1, 7), decision="Go")
+        session.add_all([log, decision])
+        session.commit()
+
+        assert (log.id, decision.id) == (2, 1)
+        assert get_daily_log_by_date(session, date(2025, 1, 6)).id == 1
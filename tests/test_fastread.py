@@ -0,0 +1,62 @@
+"""
+Tests for the raw sqlite3 read path.
+"""
+
+import subprocess
+import sys
+from datetime import date, timedelta
+
+from src.core import fastread
+from src.core.database import init_database, scoped_session
+from src.core.metrics import get_dashboard_snapshot
+from src.core.models import DailyLog, Project
+
+
+def test_get_daily_log(mock_env):
+    """Test reading today's log without the ORM."""
+    init_database()
+    with scoped_session() as session:
+        session.add(DailyLog(date=date.today(), energy="low", mission="Ship it"))
+        session.commit()
+
+    with fastread.connect() as conn:
+        log = fastread.get_daily_log(conn, date.today())
+        missing = fastread.get_daily_log(conn, date.today() - timedelta(days=1))
+
+    assert log["energy"] == "low"
+    assert log["mission"] == "Ship it"
+    assert missing is None
+
+
+def test_dashboard_snapshot_matches_orm(mock_env):
+    """Test the raw dashboard snapshot equals the ORM one."""
+    init_database()
+    today = date.today()
+    with scoped_session() as session:
+        session.bulk_save_objects(
+            [
+                DailyLog(
+                    date=today - timedelta(days=i),
+                    mission=f"Mission {i}",
+                    mission_status="shipped" if i % 3 == 0 else "deferred",
+                    paralysis_signals=(i == 2),
+                )
+                for i in range(8)
+            ]
+        )
+        session.add(Project(name="Active", status="active", target_date=today))
+        session.commit()
+
+        expected = get_dashboard_snapshot(session)
+
+    with fastread.connect() as conn:
+        assert fastread.get_dashboard_snapshot(conn) == expected
+
+
+def test_fastread_does_not_import_sqlalchemy():
+    """Test the raw read path stays free of SQLAlchemy and the models."""
+    code = (
+        "import sys, src.core.fastread; "
+        "sys.exit('sqlalchemy' in sys.modules or 'src.core.models' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,48 @@
+"""
+Tests for the top-level CLI and its lazily imported subcommands.
+"""
+
+import subprocess
+import sys
+
+from src.core.database import init_database
+
+
+def test_subcommand_resolves_without_argv(mock_env):
+    """Test subcommands load from the parsed args, not from sys.argv."""
+    init_database()
+    code = (
+        "import sys; sys.argv = ['pytest']\n"
+        "from typer.testing import CliRunner\n"
+        "from src.cli.main import app\n"
+        "result = CliRunner().invoke(app, ['daily', 'show'])\n"
+        "print(result.output)\n"
+        "sys.exit(result.exit_code)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "No check-in today" in result.stdout
+
+
+def test_help_imports_no_subcommand():
+    """Test `ceo --help` lists the groups without importing them."""
+    code = (
+        "import sys; sys.argv = ['ceo', '--help']\n"
+        "from src.cli.main import app\n"
+        "try:\n"
+        "    app()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.exit(any(f'src.cli.{n}' in sys.modules"
+        " for n in ('daily', 'project', 'emergency')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0
+    for name in ("daily", "project", "emergency"):
+        assert name in result.stdout
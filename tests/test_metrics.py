@@ -5,16 +5,21 @@ Tests for metrics calculations.
 from datetime import date, timedelta
 
 import pytest
+from sqlalchemy import insert
 
 from src.core.metrics import (
     can_add_project,
     check_circuit_breaker_conditions,
+    count_active_projects,
     get_active_projects,
+    get_dashboard_snapshot,
+    get_decision_stats,
     get_paralysis_rate,
+    get_project_slots,
     get_today_status,
     get_week_stats,
 )
-from src.core.models import DailyLog, Project
+from src.core.models import DailyLog, Decision, Project
 
 
 def test_get_today_status_empty(test_db_session):
@@ -54,17 +59,16 @@ def test_week_stats_with_data(test_db_session):
     # Create logs for this week starting from Monday
     week_start = get_week_start()
 
-    for i in range(5):
-        log_date = week_start + timedelta(days=i)
-        status = "shipped" if i < 3 else "blocked"
-
-        log = DailyLog(
-            date=log_date,
-            mission=f"Mission {i}",
-            mission_status=status,
-        )
-        test_db_session.add(log)
-
+    test_db_session.bulk_save_objects(
+        [
+            DailyLog(
+                date=week_start + timedelta(days=i),
+                mission=f"Mission {i}",
+                mission_status="shipped" if i < 3 else "blocked",
+            )
+            for i in range(5)
+        ]
+    )
     test_db_session.commit()
 
     stats = get_week_stats(test_db_session)
@@ -74,16 +78,46 @@ def test_week_stats_with_data(test_db_session):
     assert stats["completion_rate"] == 60.0
 
 
+def test_week_stats_compares_previous_week(test_db_session):
+    """Test improving compares against the previous Monday-Sunday week."""
+    from src.core.metrics import get_week_start
+
+    week_start = get_week_start()
+    test_db_session.add_all(
+        [
+            DailyLog(date=week_start, mission="This week", mission_status="shipped"),
+            # Sunday closes the previous week
+            DailyLog(
+                date=week_start - timedelta(days=1),
+                mission="Last week",
+                mission_status="blocked",
+            ),
+        ]
+    )
+    test_db_session.commit()
+
+    this_week = get_week_stats(test_db_session)
+    last_week = get_week_stats(test_db_session, weeks_ago=1)
+
+    assert (this_week["shipped"], this_week["total"]) == (1, 1)
+    assert (last_week["shipped"], last_week["total"]) == (0, 1)
+    assert this_week["improving"] is True
+    assert last_week["improving"] is False
+
+
 def test_paralysis_rate_calculation(test_db_session):
     """Test paralysis rate calculation."""
     # Create logs with paralysis signals
-    for i in range(10):
-        log = DailyLog(
-            date=date.today() - timedelta(days=i),
-            paralysis_signals=(i < 3),  # 3 out of 10 have paralysis
-        )
-        test_db_session.add(log)
-
+    test_db_session.execute(
+        insert(DailyLog),
+        [
+            {
+                "date": date.today() - timedelta(days=i),
+                "paralysis_signals": i < 3,  # 3 out of 10 have paralysis
+            }
+            for i in range(10)
+        ],
+    )
     test_db_session.commit()
 
     stats = get_paralysis_rate(test_db_session, days=30)
@@ -93,6 +127,28 @@ def test_paralysis_rate_calculation(test_db_session):
     assert stats["paralysis_rate"] == 30.0
 
 
+def test_metrics_use_reference_date(test_db_session):
+    """Test metrics count relative to an explicit `today`."""
+    today = date(2025, 1, 8)  # Wednesday
+    test_db_session.bulk_save_objects(
+        [
+            DailyLog(
+                date=today - timedelta(days=i),
+                mission=f"Mission {i}",
+                mission_status="shipped",
+                paralysis_signals=True,
+            )
+            for i in range(3)
+        ]
+    )
+    test_db_session.commit()
+
+    assert get_week_stats(test_db_session, today=today)["total"] == 3
+    assert get_week_stats(test_db_session)["total"] == 0
+    assert get_paralysis_rate(test_db_session, today=today)["paralysis_days"] == 3
+    assert get_today_status(test_db_session, today=today).mission == "Mission 0"
+
+
 def test_get_active_projects(test_db_session):
     """Test getting active projects."""
     # Create mix of projects
@@ -101,13 +157,14 @@ def test_get_active_projects(test_db_session):
     shipped = Project(name="Shipped", status="shipped")
     killed = Project(name="Killed", status="killed")
 
-    test_db_session.add_all([active1, active2, shipped, killed])
+    test_db_session.bulk_save_objects([active1, active2, shipped, killed])
     test_db_session.commit()
 
     active = get_active_projects(test_db_session)
 
     assert len(active) == 2
     assert all(p.status == "active" for p in active)
+    assert count_active_projects(test_db_session) == 2
 
 
 def test_can_add_project_below_cap(test_db_session):
@@ -125,25 +182,66 @@ def test_can_add_project_below_cap(test_db_session):
 def test_can_add_project_at_cap(test_db_session):
     """Test cannot add project when at cap."""
     # Add 3 active projects (at cap)
-    for i in range(3):
-        p = Project(name=f"Project {i}", status="active")
-        test_db_session.add(p)
-
+    test_db_session.bulk_save_objects(
+        [Project(name=f"Project {i}", status="active") for i in range(3)]
+    )
     test_db_session.commit()
 
     assert can_add_project(test_db_session) is False
 
 
+def test_get_project_slots(test_db_session):
+    """Test the slot check returns the active list and the cap result."""
+    test_db_session.bulk_save_objects(
+        [Project(name=f"Project {i}", status="active") for i in range(3)]
+    )
+    test_db_session.commit()
+
+    active, has_slot = get_project_slots(test_db_session)
+
+    assert len(active) == 3
+    assert has_slot is False
+
+    active[0].status = "shipped"
+    test_db_session.flush()
+    assert get_project_slots(test_db_session)[1] is True
+
+
+def test_decision_stats(test_db_session):
+    """Test decision timing statistics."""
+    today = date.today()
+    test_db_session.add_all(
+        [
+            Decision(
+                date=today,
+                decision="A",
+                time_to_decide=10,
+                made_under_paralysis=True,
+            ),
+            Decision(date=today, decision="B", time_to_decide=30),
+            Decision(date=today, decision="C"),  # untimed
+        ]
+    )
+    test_db_session.commit()
+
+    stats = get_decision_stats(test_db_session)
+
+    assert stats["total_decisions"] == 3
+    assert stats["avg_time"] == 20
+    assert stats["under_20min_rate"] == 50.0
+    assert stats["paralysis_decisions"] == 1
+
+
 def test_circuit_breaker_paralysis_trigger(test_db_session):
     """Test circuit breaker triggers on high paralysis rate."""
     # Create 6 days with paralysis in last 30 days
-    for i in range(6):
-        log = DailyLog(
-            date=date.today() - timedelta(days=i),
-            paralysis_signals=True,
-        )
-        test_db_session.add(log)
-
+    test_db_session.execute(
+        insert(DailyLog),
+        [
+            {"date": date.today() - timedelta(days=i), "paralysis_signals": True}
+            for i in range(6)
+        ],
+    )
     test_db_session.commit()
 
     should_trigger, reasons = check_circuit_breaker_conditions(test_db_session)
@@ -158,24 +256,17 @@ def test_circuit_breaker_completion_rate_trigger(test_db_session):
     # Create 2 weeks of low completion
     today = date.today()
 
-    # This week: 1/5 completed (20%)
-    for i in range(5):
-        log = DailyLog(
-            date=today - timedelta(days=i),
-            mission=f"Mission {i}",
-            mission_status="shipped" if i == 0 else "blocked",
-        )
-        test_db_session.add(log)
-
-    # Last week: 1/5 completed (20%)
-    for i in range(7, 12):
-        log = DailyLog(
-            date=today - timedelta(days=i),
-            mission=f"Mission {i}",
-            mission_status="shipped" if i == 7 else "blocked",
-        )
-        test_db_session.add(log)
-
+    # This week: 1/5 completed (20%), last week: 1/5 completed (20%)
+    test_db_session.bulk_save_objects(
+        [
+            DailyLog(
+                date=today - timedelta(days=i),
+                mission=f"Mission {i}",
+                mission_status="shipped" if i in (0, 7) else "blocked",
+            )
+            for i in (*range(5), *range(7, 12))
+        ]
+    )
     test_db_session.commit()
 
     should_trigger, reasons = check_circuit_breaker_conditions(test_db_session)
@@ -187,18 +278,87 @@ def test_circuit_breaker_completion_rate_trigger(test_db_session):
 def test_circuit_breaker_no_trigger_healthy(test_db_session):
     """Test circuit breaker doesn't trigger when healthy."""
     # Create healthy data
-    for i in range(5):
-        log = DailyLog(
-            date=date.today() - timedelta(days=i),
-            paralysis_signals=False,
-            mission=f"Mission {i}",
-            mission_status="shipped",
-        )
-        test_db_session.add(log)
-
+    test_db_session.bulk_save_objects(
+        [
+            DailyLog(
+                date=date.today() - timedelta(days=i),
+                paralysis_signals=False,
+                mission=f"Mission {i}",
+                mission_status="shipped",
+            )
+            for i in range(5)
+        ]
+    )
     test_db_session.commit()
 
     should_trigger, reasons = check_circuit_breaker_conditions(test_db_session)
 
     assert should_trigger is False
     assert len(reasons) == 0
+
+
+def test_circuit_breaker_stalled_projects_trigger(test_db_session):
+    """Test circuit breaker triggers on 3 active projects and a blocked day."""
+    test_db_session.add(
+        DailyLog(date=date.today(), mission="Mission", mission_status="blocked")
+    )
+    test_db_session.bulk_save_objects(
+        [Project(name=f"Project {i}", status="active") for i in range(3)]
+    )
+    test_db_session.commit()
+
+    should_trigger, reasons = check_circuit_breaker_conditions(test_db_session)
+
+    assert should_trigger is True
+    assert "All projects stalled (mission blocked)" in reasons
+
+
+def test_dashboard_snapshot_empty(test_db_session):
+    """Test dashboard snapshot with no data."""
+    snapshot = get_dashboard_snapshot(test_db_session)
+
+    assert snapshot.today_mission is None
+    assert snapshot.today_mission_status is None
+    assert snapshot.week["total"] == 0
+    assert snapshot.week["completion_rate"] == 0
+    assert snapshot.paralysis["total_days"] == 0
+    assert snapshot.active_projects == []
+
+
+def test_dashboard_snapshot_matches_metrics(test_db_session):
+    """Test dashboard snapshot agrees with the individual metric queries."""
+    today = date.today()
+
+    test_db_session.bulk_save_objects(
+        [
+            DailyLog(
+                date=today - timedelta(days=i),
+                mission=f"Mission {i}",
+                mission_status="shipped" if i % 2 == 0 else "blocked",
+                paralysis_signals=(i < 3),
+            )
+            for i in range(10)
+        ]
+    )
+
+    deadline = today + timedelta(days=5)
+    test_db_session.bulk_save_objects(
+        [
+            Project(name="Active 1", status="active", target_date=deadline),
+            Project(name="Active 2", status="active"),
+            Project(name="Shipped", status="shipped"),
+        ]
+    )
+    test_db_session.commit()
+
+    snapshot = get_dashboard_snapshot(test_db_session)
+
+    assert snapshot.today_mission == "Mission 0"
+    assert snapshot.today_mission_status == "shipped"
+    week = get_week_stats(test_db_session)
+    assert snapshot.week == week
+    assert snapshot.paralysis == get_paralysis_rate(test_db_session, days=30)
+    assert sorted(snapshot.active_projects) == [
+        ("Active 1", deadline),
+        ("Active 2", None),
+    ]
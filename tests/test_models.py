@@ -5,80 +5,64 @@ Tests for database models.
 from datetime import date
 
 import pytest
+from sqlalchemy import inspect
 
+from src.core.dashboard import days_until
 from src.core.models import DailyLog, Decision, Project
 
+TODAY = date.today()
 
-def test_daily_log_creation(test_db_session):
-    """Test creating a daily log entry."""
-    log = DailyLog(
-        date=date.today(),
-        energy="high",
-        paralysis_signals=False,
-        mission="Ship feature X",
-        mission_status="shipped",
-    )
-
-    test_db_session.add(log)
-    test_db_session.commit()
 
-    # Retrieve and verify
-    retrieved = test_db_session.query(DailyLog).filter_by(date=date.today()).first()
+def test_daily_log_creation(sample_rows):
+    """Test creating a daily log entry."""
+    # Committed instance keeps its attributes (expire_on_commit=False)
+    log = sample_rows["daily_log"]
 
-    assert retrieved is not None
-    assert retrieved.energy == "high"
-    assert retrieved.mission == "Ship feature X"
-    assert retrieved.is_complete is True
+    assert log.id is not None
+    assert log.energy == "high"
+    assert log.mission == "Ship feature X"
+    assert log.is_complete is True
+    assert log.paralysis_signals is False  # server default
 
 
-def test_daily_log_paralysis_detection(test_db_session):
+# pure-python: no DB
+def test_daily_log_paralysis_detection():
     """Test paralysis signal detection."""
     log1 = DailyLog(
-        date=date.today(),
+        date=TODAY,
         paralysis_signals=True,
     )
 
     assert log1.paralysis_signals is True
 
 
-def test_daily_log_blocked_by_me(test_db_session):
+# pure-python: no DB
+@pytest.mark.parametrize(
+    "blocker_type,expected",
+    [("me_decision", True), ("external", False)],
+)
+def test_daily_log_blocked_by_me(blocker_type, expected):
     """Test detection of self-blocking."""
     log = DailyLog(
-        date=date.today(),
+        date=TODAY,
         mission_status="blocked",
-        blocker_type="me_decision",
+        blocker_type=blocker_type,
     )
 
-    assert log.blocked_by_me is True
+    assert log.blocked_by_me is expected
 
-    log2 = DailyLog(
-        date=date.today(),
-        mission_status="blocked",
-        blocker_type="external",
-    )
 
-    assert log2.blocked_by_me is False
-
-
-def test_project_creation(test_db_session):
+def test_project_creation(sample_rows):
     """Test creating a project."""
-    project = Project(
-        name="Launch MVP",
-        target_date=date(2024, 12, 31),
-        status="active",
-    )
-
-    test_db_session.add(project)
-    test_db_session.commit()
-
-    retrieved = test_db_session.query(Project).filter_by(name="Launch MVP").first()
+    project = sample_rows["project"]
 
-    assert retrieved is not None
-    assert retrieved.is_active is True
-    assert retrieved.days_remaining is not None
+    assert project.id is not None
+    assert project.is_active is True
+    assert project.days_remaining is not None
 
 
-def test_project_days_remaining(test_db_session):
+# pure-python: no DB
+def test_project_days_remaining():
     """Test days remaining calculation."""
     future_date = date(2025, 12, 31)
 
@@ -89,57 +73,37 @@ def test_project_days_remaining(test_db_session):
 
     # Days remaining should be positive for future dates
     assert project.days_remaining is not None
+    assert inspect(project).transient
+    assert days_until(project.target_date, date(2025, 12, 1)) == 30
 
 
-def test_decision_creation(test_db_session):
+def test_decision_creation(sample_rows):
     """Test creating a decision record."""
-    decision = Decision(
-        date=date.today(),
-        decision="Hire candidate A",
-        time_to_decide=15,
-        made_under_paralysis=True,
-        outcome="proceeded",
-    )
+    decision = sample_rows["decision"]
 
-    test_db_session.add(decision)
-    test_db_session.commit()
+    assert decision.id is not None
+    assert decision.under_20_minutes is True
+    assert decision.made_under_paralysis is True
 
-    retrieved = test_db_session.query(Decision).first()
 
-    assert retrieved is not None
-    assert retrieved.under_20_minutes is True
-    assert retrieved.made_under_paralysis is True
-
-
-def test_decision_timing(test_db_session):
+# pure-python: no DB
+@pytest.mark.parametrize("time_to_decide,expected", [(10, True), (45, False)])
+def test_decision_timing(time_to_decide, expected):
     """Test decision timing validation."""
-    fast = Decision(date=date.today(), decision="Quick choice", time_to_decide=10)
-    slow = Decision(date=date.today(), decision="Slow choice", time_to_decide=45)
+    decision = Decision(
+        date=TODAY, decision="Choice", time_to_decide=time_to_decide
+    )
 
-    assert fast.under_20_minutes is True
-    assert slow.under_20_minutes is False
+    assert decision.under_20_minutes is expected
 
 
-def test_decision_needs_followup(test_db_session):
+# pure-python: no DB
+@pytest.mark.parametrize(
+    "outcome,expected",
+    [("blocked", True), ("revisited", True), ("proceeded", False)],
+)
+def test_decision_needs_followup(outcome, expected):
     """Test decision follow-up detection."""
-    blocked = Decision(
-        date=date.today(),
-        decision="Test",
-        outcome="blocked",
-    )
-
-    revisited = Decision(
-        date=date.today(),
-        decision="Test",
-        outcome="revisited",
-    )
-
-    proceeded = Decision(
-        date=date.today(),
-        decision="Test",
-        outcome="proceeded",
-    )
+    decision = Decision(date=TODAY, decision="Test", outcome=outcome)
 
-    assert blocked.needs_followup is True
-    assert revisited.needs_followup is True
-    assert proceeded.needs_followup is False
+    assert decision.needs_followup is expected
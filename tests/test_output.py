@@ -0,0 +1,22 @@
+"""
+Tests for CLI output helpers.
+"""
+
+import io
+
+from rich.console import Console
+
+from src.cli.output import ask_choice
+
+CHOICES = ("high", "medium", "low")
+
+
+def test_ask_choice_reads_stdin_when_scripted(monkeypatch):
+    """Test scripted answers are read line by line and validated."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("bogus\nlow\n\n"))
+    console = Console(file=io.StringIO())
+
+    assert ask_choice(console, "Energy", CHOICES, default="medium") == "low"
+    assert ask_choice(console, "Energy", CHOICES, default="medium") == "medium"
+    assert ask_choice(console, "Energy", CHOICES, default="medium") == "medium"
+    assert "Please select" in console.file.getvalue()